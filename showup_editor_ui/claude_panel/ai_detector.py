@@ -654,35 +654,78 @@ the original meaning and educational value.
         Returns:
             dict: Analysis results containing detected patterns and statistics
         """
-        if not selected_text or not selected_text.strip():
-            messagebox.showinfo("No Text Selected", "Please select some text to analyze.")
-            logger.warning("User attempted to analyze empty text selection")
+        if not self.has_text_to_analyze(selected_text):
             return None
             
         try:
-            logger.info("Analyzing selected text for AI writing patterns")
-            
             # Analyze selected text for AI patterns
-            detection_result = self._detect_ai_patterns(selected_text)
+            detection_result = self.detect_selected_text(selected_text)
             
             # Create a report tab or update existing one
-            self._create_or_update_selected_text_report(detection_result)
-            
-            # Log results
-            if detection_result["detected"]:
-                logger.info(f"AI writing analysis complete: Found {detection_result['count']} AI patterns")
-            else:
-                logger.info("AI writing analysis complete: No AI patterns detected")
+            self.show_selected_text_report(detection_result)
             
             # Return the result for potential further processing
             return detection_result
             
         except Exception as e:
-            error_msg = f"Error analyzing selected text: {str(e)}"
-            logger.error(error_msg)
-            messagebox.showerror("Analysis Error", error_msg)
+            self.report_selected_text_error(e)
             return None
     
+    def has_text_to_analyze(self, selected_text):
+        """Check there is text to analyze, telling the user if there isn't.
+        
+        Args:
+            selected_text (str): The text selected by the user to analyze
+        
+        Returns:
+            bool: True if the text is not empty or whitespace
+        """
+        if not selected_text or not selected_text.strip():
+            messagebox.showinfo("No Text Selected", "Please select some text to analyze.")
+            logger.warning("User attempted to analyze empty text selection")
+            return False
+        return True
+    
+    def detect_selected_text(self, selected_text):
+        """Detect AI patterns in selected text without touching any widgets.
+        
+        Only reads the loaded patterns and option flags, so it is safe to run
+        on a worker thread; pass the result to show_selected_text_report on
+        the Tk thread.
+        
+        Args:
+            selected_text (str): The text selected by the user to analyze
+        
+        Returns:
+            dict: Analysis results containing detected patterns and statistics
+        """
+        logger.info("Analyzing selected text for AI writing patterns")
+        return self._detect_ai_patterns(selected_text)
+    
+    def show_selected_text_report(self, detection_result):
+        """Show the report for a detect_selected_text result. Tk thread only.
+        
+        Args:
+            detection_result (dict): The detection results from detect_selected_text
+        """
+        self._create_or_update_selected_text_report(detection_result)
+        
+        # Log results
+        if detection_result["detected"]:
+            logger.info(f"AI writing analysis complete: Found {detection_result['count']} AI patterns")
+        else:
+            logger.info("AI writing analysis complete: No AI patterns detected")
+    
+    def report_selected_text_error(self, error):
+        """Log and show an error raised while analyzing selected text.
+        
+        Args:
+            error (Exception): The error raised by detection or the report
+        """
+        error_msg = f"Error analyzing selected text: {str(error)}"
+        logger.error(error_msg)
+        messagebox.showerror("Analysis Error", error_msg)
+    
     def _create_or_update_selected_text_report(self, detection_result):
         """Create or update the report tab for the selected text analysis.
         
@@ -0,0 +1,67 @@
+"""Filesystem helpers for the library file tree."""
+
+import os
+import shutil
+import stat
+import sys
+
+
+def _remove_readonly(func, path, _exc_info):
+    """``shutil.rmtree`` error hook that clears the read-only bit and retries."""
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def _is_reparse_point(st):
+    """Return True if ``st`` describes a Windows reparse point such as a junction."""
+    return bool(getattr(st, "st_file_attributes", 0) & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+def fast_rmtree(path):
+    """Delete a directory tree with a single ``os.scandir`` walk.
+
+    Files are unlinked in one pass, then directories are removed bottom-up.
+    Junctions and other directory reparse points are removed as links and
+    never descended into, as ``shutil.rmtree`` does. If any file refuses
+    deletion with ``PermissionError`` the remainder is handed to
+    ``shutil.rmtree`` with a hook that clears the read-only bit.
+    """
+    if os.path.islink(path) or _is_reparse_point(os.lstat(path)):
+        raise OSError("Cannot call rmtree on a symbolic link")
+
+    files = []
+    links = []
+    dirs = [path]
+    pending = [path]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    files.append(entry.path)
+                elif _is_reparse_point(entry.stat(follow_symlinks=False)):
+                    links.append(entry.path)
+                else:
+                    dirs.append(entry.path)
+                    pending.append(entry.path)
+
+    blocked = False
+    for file_path in files:
+        try:
+            os.unlink(file_path)
+        except PermissionError:
+            blocked = True
+
+    if blocked:
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(path, onexc=_remove_readonly)
+        else:
+            shutil.rmtree(path, onerror=_remove_readonly)
+        return
+
+    # Removing a junction leaves its target untouched
+    for link_path in links:
+        os.rmdir(link_path)
+
+    # Parents are always listed before their children
+    for dir_path in reversed(dirs):
+        os.rmdir(dir_path)
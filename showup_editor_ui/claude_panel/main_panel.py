@@ -3,14 +3,23 @@
 import os
 import sys
 import json
+import glob
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext, simpledialog
 import logging
-import shutil
 import subprocess
 from .path_utils import get_project_root
+from .fs_utils import fast_rmtree
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Import config manager
 from .config_manager import config_manager
@@ -36,11 +45,284 @@ from .enrich_lesson import EnrichLessonPanel  # Import the enrich lesson panel
 
 # Import CLAUDE_MODELS configuration from the module
 from claude_api import CLAUDE_MODELS
+from cache_utils import set_local_cache_enabled
 
 # Get logger
 logger = logging.getLogger("output_library_editor")
 
-class ClaudeAIPanel(ttk.Frame):
+# Extensions opened in the markdown editor / accepted by the markdown tools
+_EDITABLE_EXTS = (".md", ".txt")
+_MD_EXTS = (".md", ".markdown")
+
+# Text selection lookups used on the selection hot paths
+_SEL_FIRST, _SEL_LAST = tk.SEL_FIRST, tk.SEL_LAST
+_TEXT_WIDGET_TYPES = (tk.Text, scrolledtext.ScrolledText)
+
+
+@lru_cache(maxsize=4096)
+def _ext(path):
+    """Return the lower-cased extension of ``path`` (memoized for tree paths)."""
+    return os.path.splitext(path)[1].lower()
+
+
+@lru_cache(maxsize=4096)
+def _basename(path):
+    """Return the final component of ``path`` (memoized for tree paths)."""
+    return os.path.basename(path)
+
+
+def _startfile(path):
+    """Open ``path`` with its default application via ``os.startfile``.
+
+    ``os.startfile`` only exists on Windows; resolving it here, inside the
+    shell worker, lets a missing attribute surface as a normal error dialog.
+    """
+    os.startfile(path)
+
+
+class _FileTreeActionsMixin:
+    """File tree actions (open, rename, reveal) for ``ClaudeAIPanel``."""
+
+    def _show_file_tree_context_menu(self, event):
+        """Show the context menu for the file tree."""
+        # Select the item under cursor
+        item = self.file_tree.identify_row(event.y)
+        if item:
+            # If clicking on a new item, select it
+            if item not in self._selection():
+                self.file_tree.selection_set(item)
+                self._selection_cache = None
+            
+            # Show the context menu
+            self.file_tree_menu.post(event.x_root, event.y_root)
+    
+    def _on_file_double_click(self, event):
+        """Handle double click on a file."""
+        item_id = self.file_tree.focus()
+        if not item_id:
+            return
+        
+        # Get the file path
+        item_values = self.file_tree.item(item_id, "values")
+        if not item_values:
+            return
+        
+        file_path = item_values[0]
+        file_type = item_values[1] if len(item_values) > 1 else ""
+        ext = item_values[2] if len(item_values) > 2 else None
+        
+        # Only handle files, not directories
+        if file_type != "directory":
+            # Open the file in the editor
+            self._open_file(file_path, ext)
+    
+    def _on_file_select(self, event):
+        """Load the selected file into the Enrich Lesson panel once selection settles."""
+        # The selection changed, so the memoized tuple is stale
+        self._selection_cache = None
+        if not self._selection():
+            return
+
+        # Holding an arrow key fires an event per row; only load the last one
+        if self._select_pending:
+            self.file_tree.after_cancel(self._select_pending)
+        self._select_pending = self.file_tree.after(120, self._do_file_select)
+
+    def _do_file_select(self):
+        """Load the current selection scheduled by ``_on_file_select``."""
+        self._select_pending = None
+        selected = self._selection()
+        if not selected:
+            return
+
+        item_id = selected[0]
+        item_values = self.file_tree.item(item_id, "values")
+        if not item_values:
+            return
+
+        path = item_values[0]
+        if len(item_values) > 1 and item_values[1] == "directory":
+            return
+        try:
+            self.enrich_lesson.load_current_lesson(path)
+        except Exception as exc:
+            logger.error(f"Failed to load lesson for enrichment: {exc}")
+    
+    def _open_file(self, file_path, ext=None):
+        """Open a file in the appropriate panel.
+
+        Args:
+            file_path: Path of the file to open
+            ext: Lower-cased extension cached on the tree row, if known
+        """
+        try:
+            if not os.path.isfile(file_path):
+                logger.warning(f"Cannot open non-file: {file_path}")
+                return
+                
+            # Check file extension to determine how to open it
+            if ext is None:
+                ext = _ext(file_path)
+            
+            if ext in _EDITABLE_EXTS:
+                # Open in the Markdown Editor tab by default
+                self.notebook.select(self.markdown_editor_tab)
+                self.markdown_editor.open_file(file_path)
+                try:
+                    # Keep Enrich Lesson panel in sync when files are opened
+                    self.enrich_lesson.load_current_lesson(file_path)
+                except Exception as exc:
+                    logger.error(
+                        f"Failed to load lesson for enrichment: {exc}",
+                    )
+                logger.info(f"Opened file: {file_path}")
+            else:
+                logger.warning(f"Unsupported file type: {ext}")
+                messagebox.showwarning("Unsupported File", f"Files with extension {ext} are not supported for editing.")
+        except Exception as e:
+            logger.error(f"Error opening file: {str(e)}")
+            messagebox.showerror("Error", f"Could not open file: {str(e)}")
+    
+    def _open_file_in_editor(self):
+        """Open the selected file in the markdown editor."""
+        selected_items = self._collect_selected()
+        
+        if not selected_items:
+            return
+        
+        for item_id, item_values in selected_items:
+            if not item_values or len(item_values) < 2:
+                continue
+            
+            file_path = item_values[0]
+            item_type = item_values[1]
+            
+            if item_type == "file" and os.path.isfile(file_path):
+                # If it's a markdown file, open it in the editor
+                if file_path.endswith(_EDITABLE_EXTS):
+                    # Switch to the markdown editor tab
+                    self.notebook.select(self.markdown_editor_tab)
+                    
+                    # Tell the markdown editor to open the file
+                    self.markdown_editor.open_file(file_path)
+                    
+                    logger.info(f"Opened file in markdown editor: {file_path}")
+                    break
+                else:
+                    # Try to open in system editor
+                    self._open_in_system_editor()
+    
+    _open_selected_file = _open_file_in_editor
+    
+    def _open_in_system_editor(self):
+        """Open the selected file in the system's default editor."""
+        selected_items = self._collect_selected()
+        if not selected_items:
+            return
+            
+        for item_id, item_values in selected_items:
+            if not item_values or len(item_values) < 2:
+                continue
+                
+            file_path = item_values[0]
+            item_type = item_values[1]
+            
+            # Only open files, not directories
+            if item_type != "directory" and os.path.isfile(file_path):
+                # Use the system's default application to open the file
+                self._submit_shell(
+                    _startfile, file_path,
+                    done=f"Opened file in system editor: {file_path}",
+                    failed="Failed to open file"
+                )
+    
+    def _rename_selected(self):
+        """Rename the selected file or directory."""
+        selected_items = self._collect_selected()
+        if not selected_items:
+            return
+            
+        # Get the selected item
+        item_id, item_values = selected_items[0]  # Only rename one at a time
+        if not item_values or len(item_values) < 2:
+            return
+            
+        path = item_values[0]
+        item_type = item_values[1]
+        
+        # Get current name and ask for new name
+        current_name = _basename(path)
+        parent_dir = os.path.dirname(path)
+        
+        new_name = simpledialog.askstring("Rename", "Enter new name:", initialvalue=current_name)
+        if not new_name or new_name == current_name:
+            return
+            
+        # Create full new path
+        new_path = os.path.join(parent_dir, new_name)
+        
+        # Check if target already exists
+        if os.path.exists(new_path):
+            messagebox.showerror("Error", f"Cannot rename: {new_name} already exists.")
+            return
+            
+        try:
+            # Rename the file or directory
+            os.rename(path, new_path)
+            logger.info(f"Renamed {path} to {new_path}")
+            
+            # Refresh tree
+            self._schedule_refresh()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to rename: {str(e)}")
+            logger.error(f"Failed to rename {path}: {str(e)}")
+    
+    def _show_in_explorer(self):
+        """Show the selected file or directory in Windows Explorer."""
+        selected_items = self._collect_selected()
+        if not selected_items:
+            return
+            
+        for item_id, item_values in selected_items:
+            if not item_values:
+                continue
+                
+            path = item_values[0]
+            
+            # If it's a file, select it in Explorer; otherwise open the directory
+            if os.path.isfile(path):
+                func, arg = subprocess.run, ["explorer", "/select,", path]
+            else:
+                func, arg = _startfile, path
+            self._submit_shell(
+                func, arg,
+                done=f"Opened in Explorer: {path}",
+                failed="Failed to open in Explorer"
+            )
+            break  # Only show one item
+
+    def _submit_shell(self, func, arg, done, failed):
+        """Run a blocking shell call on the shell pool so Tk keeps responding.
+
+        Args:
+            func: Blocking callable such as ``_startfile`` or ``subprocess.run``
+            arg: Single argument passed to ``func``
+            done: Message logged once the call returns
+            failed: Prefix for the error logged and shown if the call raises
+        """
+        def run():
+            try:
+                func(arg)
+                logger.info(done)
+            except Exception as e:
+                message = f"{failed}: {str(e)}"
+                logger.error(message)
+                self.after(0, lambda: messagebox.showerror("Error", message))
+
+        self._shell_pool.submit(run)
+
+
+class ClaudeAIPanel(_FileTreeActionsMixin, ttk.Frame):
     """Panel for Claude AI integration with prompt configuration and processing."""
     
     def __init__(self, parent, main_app, *args, **kwargs):
@@ -50,6 +332,17 @@ class ClaudeAIPanel(ttk.Frame):
         self.batch_files = []  # List to store batch file paths
         self.batch_results = {}  # Dictionary to store batch results
         self.processing_batch = False  # Flag to indicate batch processing
+        self._refresh_pending = None  # after() id of a scheduled library refresh
+        self._text_widget_cache = {}  # tab path -> text widgets found in that tab
+        self._text_widget_cache_bound = set()  # tab paths with an invalidation binding
+        self._status_flush_pending = False  # update_idletasks queued for the status bar
+        self._select_pending = None  # after() id of a deferred file tree selection
+        self._selection_cache = None  # file_tree.selection() until the selection changes
+        self._shell_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="shell")
+        self._analysis_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai-detect")
+        # One worker, so confirmed deletes run one batch at a time in order
+        self._delete_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="delete")
+        self._delete_batches = 0  # delete batches queued or running
         
         # Initialize model variables with centralized model configuration
         self.context_model = CLAUDE_MODELS["CONTEXT_GEN"]  # Use centralized model configuration
@@ -162,6 +455,7 @@ class ClaudeAIPanel(ttk.Frame):
         # Create tabs
         self.prompt_tab = ttk.Frame(self.notebook)
         self.markdown_editor_tab = ttk.Frame(self.notebook)
+        self._markdown_editor_tab_path = str(self.markdown_editor_tab)
         self.batch_tab = ttk.Frame(self.notebook)
         self.full_regen_tab = ttk.Frame(self.notebook)
         self.ai_detect_tab = ttk.Frame(self.notebook)
@@ -197,6 +491,9 @@ class ClaudeAIPanel(ttk.Frame):
         self.notebook.add(self.lesson_preview_tab, text="Lesson Preview")  # Add new lesson preview tab
         self.notebook.add(self.enrich_lesson_tab, text="Enrich Lesson")  # Add new enrich lesson tab
         
+        # Map tab paths (as returned by notebook.select()) back to their frames
+        self._tab_frames_by_path = {str(tab): tab for tab in self.notebook.winfo_children()}
+        
         # Log tab indices for debugging
         logger.info("ClaudeAIPanel tabs created with following indexes:")
         logger.info(f"Prompt Config tab index: {self.notebook.index(self.prompt_tab)}")
@@ -356,6 +653,7 @@ class ClaudeAIPanel(ttk.Frame):
     def _populate_library(self, directory=None):
         """Populate the library tree with files and folders."""
         # Clear existing items
+        self._selection_cache = None
         for item in self.file_tree.get_children():
             self.file_tree.delete(item)
         
@@ -389,7 +687,7 @@ class ClaudeAIPanel(ttk.Frame):
                             os.makedirs(directory)
         
         # Insert root directory
-        root_id = self.file_tree.insert("", "end", text="Library", values=(directory, "directory"))
+        root_id = self.file_tree.insert("", "end", text="Library", values=(directory, "directory", ""))
         
         # Populate the tree
         self._add_directory_to_tree(directory, root_id)
@@ -398,25 +696,34 @@ class ClaudeAIPanel(ttk.Frame):
         self.file_tree.item(root_id, open=True)
     
     def _add_directory_to_tree(self, directory, parent):
-        """Add a directory and its contents to the tree."""
+        """Add a directory and its contents to the tree.
+
+        Rows are stored as ``(path, type, extension)`` so selection handlers can
+        classify items without going back to the filesystem.
+        """
         try:
-            for item in sorted(os.listdir(directory)):
-                item_path = os.path.join(directory, item)
-                
+            with os.scandir(directory) as entries:
+                entries = sorted(entries, key=lambda entry: entry.name)
+
+            for entry in entries:
+                item = entry.name
+
                 # Skip hidden files and .bak files
                 if item.startswith(".") or item.endswith(".bak"):
                     continue
-                
-                if os.path.isdir(item_path):
+
+                if entry.is_dir():
                     # Insert directory
-                    dir_id = self.file_tree.insert(parent, "end", text=item, 
-                                                values=(item_path, "directory"))
+                    dir_id = self.file_tree.insert(parent, "end", text=item,
+                                                values=(entry.path, "directory", ""))
                     # Add its contents
-                    self._add_directory_to_tree(item_path, dir_id)
-                elif item.lower().endswith(".md"):
-                    # Only display markdown files
-                    self.file_tree.insert(parent, "end", text=item, 
-                                        values=(item_path, "markdown"))
+                    self._add_directory_to_tree(entry.path, dir_id)
+                else:
+                    ext = os.path.splitext(item)[1].lower()
+                    if ext == ".md":
+                        # Only display markdown files
+                        self.file_tree.insert(parent, "end", text=item,
+                                            values=(entry.path, "markdown", ext))
                 # Other file types are not displayed in the tree
         except Exception as e:
             logger.error(f"Error adding directory to tree: {str(e)}")
@@ -424,6 +731,17 @@ class ClaudeAIPanel(ttk.Frame):
     def _refresh_library(self):
         """Refresh the library tree."""
         self._populate_library()
+
+    def _schedule_refresh(self):
+        """Refresh the library tree once a burst of file operations settles."""
+        if self._refresh_pending:
+            self.after_cancel(self._refresh_pending)
+        self._refresh_pending = self.after(200, self._do_refresh)
+
+    def _do_refresh(self):
+        """Run the library refresh scheduled by ``_schedule_refresh``."""
+        self._refresh_pending = None
+        self._refresh_library()
         
     def _filter_library(self, *args):
         """Filter library based on search text."""
@@ -615,22 +933,20 @@ class ClaudeAIPanel(ttk.Frame):
         
         # Look for profile files (JSON format)
         try:
-            for filename in os.listdir(profile_dir):
-                if filename.endswith(".json"):
-                    profile_path = os.path.join(profile_dir, filename)
-                    try:
-                        with open(profile_path, 'r', encoding='utf-8') as f:
-                            profile_data = json.load(f)
-                            
-                            # Validate profile structure
-                            if 'name' in profile_data and 'system' in profile_data:
-                                profile_name = profile_data['name']
-                                self.profiles[profile_name] = profile_data
-                                logger.info(f"Loaded profile: {profile_name}")
-                            else:
-                                logger.warning(f"Invalid profile structure in {filename}")
-                    except Exception as e:
-                        logger.error(f"Error loading profile {filename}: {str(e)}")
+            for profile_path in glob.iglob(os.path.join(glob.escape(profile_dir), "*.json")):
+                try:
+                    with open(profile_path, 'r', encoding='utf-8') as f:
+                        profile_data = json.load(f)
+                        
+                        # Validate profile structure
+                        if 'name' in profile_data and 'system' in profile_data:
+                            profile_name = profile_data['name']
+                            self.profiles[profile_name] = profile_data
+                            logger.info(f"Loaded profile: {profile_name}")
+                        else:
+                            logger.warning(f"Invalid profile structure in {_basename(profile_path)}")
+                except Exception as e:
+                    logger.error(f"Error loading profile {_basename(profile_path)}: {str(e)}")
             
             # Set default profile if available
             if self.profiles:
@@ -651,8 +967,24 @@ class ClaudeAIPanel(ttk.Frame):
                 # Save the default profile
                 default_profile_path = os.path.join(profile_dir, "default.json")
                 try:
-                    with open(default_profile_path, 'w', encoding='utf-8') as f:
-                        json.dump(default_profile, f, indent=4)
+                    if ORJSON_AVAILABLE:
+                        buf = orjson.dumps(default_profile, option=orjson.OPT_INDENT_2)
+                    else:
+                        buf = json.dumps(default_profile, indent=4).encode("utf-8")
+                    # Write to a temp file and swap it in so a crash never
+                    # leaves a truncated profile behind
+                    tmp_path = default_profile_path + ".tmp"
+                    try:
+                        with open(tmp_path, 'wb') as f:
+                            f.write(buf)
+                        os.replace(tmp_path, default_profile_path)
+                    except OSError:
+                        # Don't leave the partial temp file behind
+                        try:
+                            os.remove(tmp_path)
+                        except OSError:
+                            pass
+                        raise
                     logger.info("Created default profile")
                 except Exception as e:
                     logger.error(f"Failed to save default profile: {str(e)}")
@@ -717,31 +1049,32 @@ class ClaudeAIPanel(ttk.Frame):
         
     def _setup_text_widget_context_menu(self):
         """Set up right-click context menu for text widgets."""
-        # Create context menu for text widgets
+        # One menu per panel, so its commands always act on this panel
         self.text_widget_menu = tk.Menu(self, tearoff=0)
+        self._text_menu_target = None
         
         # Add standard edit options
-        self.text_widget_menu.add_command(label="Cut", command=lambda: self._text_widget_cut(),
-                                       accelerator="Ctrl+X")
-        self.text_widget_menu.add_command(label="Copy", command=lambda: self._text_widget_copy(),
-                                       accelerator="Ctrl+C")
-        self.text_widget_menu.add_command(label="Paste", command=lambda: self._text_widget_paste(),
-                                       accelerator="Ctrl+V")
+        self.text_widget_menu.add_command(label="Cut", command=self._text_widget_cut,
+                                          accelerator="Ctrl+X")
+        self.text_widget_menu.add_command(label="Copy", command=self._text_widget_copy,
+                                          accelerator="Ctrl+C")
+        self.text_widget_menu.add_command(label="Paste", command=self._text_widget_paste,
+                                          accelerator="Ctrl+V")
         self.text_widget_menu.add_separator()
-        self.text_widget_menu.add_command(label="Select All", command=lambda: self._text_widget_select_all(),
-                                       accelerator="Ctrl+A")
+        self.text_widget_menu.add_command(label="Select All", command=self._text_widget_select_all,
+                                          accelerator="Ctrl+A")
         self.text_widget_menu.add_separator()
         # Add AI analysis option
-        self.text_widget_menu.add_command(label="Analyze Selected Text for AI Writing", 
-                                       command=lambda: self._analyze_context_menu_selection())
+        self.text_widget_menu.add_command(label="Analyze Selected Text for AI Writing",
+                                          command=self._analyze_context_menu_selection)
         
         # Apply this context menu to all relevant text widgets
         self._bind_text_widget_context_menu()
     
     def _bind_text_widget_context_menu(self):
         """Bind the context menu to all relevant text widgets."""
-        # Bind to selected text widget
-        if hasattr(self, "selected_text_widget"):
+        # Bind to selected text widget, once the AI Detection tab has built it
+        if getattr(self, "selected_text_widget", None) is not None:
             self._bind_context_menu_to_text_widget(self.selected_text_widget)
         
         # Bind to markdown editor if it exists
@@ -756,12 +1089,13 @@ class ClaudeAIPanel(ttk.Frame):
         
     def _show_text_widget_context_menu(self, event):
         """Show the context menu for text widgets."""
-        # Get the widget that triggered the event
+        # Menu commands act on the widget that was right-clicked
         widget = event.widget
+        self._text_menu_target = widget
         
         # Try to identify if there's a selection
         try:
-            selected_text = widget.get(tk.SEL_FIRST, tk.SEL_LAST)
+            widget.get(_SEL_FIRST, _SEL_LAST)
             # Enable the analyze option if text is selected
             self.text_widget_menu.entryconfig("Analyze Selected Text for AI Writing", state=tk.NORMAL)
         except tk.TclError:
@@ -775,170 +1109,94 @@ class ClaudeAIPanel(ttk.Frame):
         """Analyze text selected via context menu."""
         # This will be called from the context menu; we can just use the editor selection method
         self._analyze_editor_selection()
+
+    def _text_menu_widget(self):
+        """Return the widget the text context menu was opened on, else the focused one."""
+        return self._text_menu_target or self.focus_get()
     
     def _text_widget_cut(self):
-        """Cut selected text from the widget that has focus."""
+        """Cut selected text from the right-clicked widget."""
         try:
-            widget = self.focus_get()
+            widget = self._text_menu_widget()
             if hasattr(widget, "cut"):
                 widget.cut()
             else:
                 widget.event_generate("<<Cut>>")
-        except:
-            pass
+        except (tk.TclError, AttributeError) as e:
+            logger.debug(f"Cut failed on text widget: {e}")
     
     def _text_widget_copy(self):
-        """Copy selected text from the widget that has focus."""
+        """Copy selected text from the right-clicked widget."""
         try:
-            widget = self.focus_get()
+            widget = self._text_menu_widget()
             if hasattr(widget, "copy"):
                 widget.copy()
             else:
                 widget.event_generate("<<Copy>>")
-        except:
-            pass
+        except (tk.TclError, AttributeError) as e:
+            logger.debug(f"Copy failed on text widget: {e}")
     
     def _text_widget_paste(self):
-        """Paste text to the widget that has focus."""
+        """Paste text into the right-clicked widget."""
         try:
-            widget = self.focus_get()
+            widget = self._text_menu_widget()
             if hasattr(widget, "paste"):
                 widget.paste()
             else:
                 widget.event_generate("<<Paste>>")
-        except:
-            pass
+        except (tk.TclError, AttributeError) as e:
+            logger.debug(f"Paste failed on text widget: {e}")
     
     def _text_widget_select_all(self):
-        """Select all text in the widget that has focus."""
+        """Select all text in the right-clicked widget."""
         try:
-            widget = self.focus_get()
+            widget = self._text_menu_widget()
             widget.tag_add(tk.SEL, "1.0", tk.END)
             widget.mark_set(tk.INSERT, "1.0")
             widget.see(tk.INSERT)
             return "break"
-        except:
-            pass
+        except (tk.TclError, AttributeError) as e:
+            logger.debug(f"Select All failed on text widget: {e}")
     
-    def _show_file_tree_context_menu(self, event):
-        """Show the context menu for the file tree on right-click."""
-        # Select the item under cursor
-        item = self.file_tree.identify_row(event.y)
-        if item:
-            self.file_tree.selection_set(item)
-        
-        # Show context menu
+    def on_close(self) -> None:
+        """Handle closing of the main window."""
         try:
-            self.file_tree_menu.tk_popup(event.x_root, event.y_root)
+            if self.enrich_lesson:
+                self.enrich_lesson.cleanup()
+        except Exception as exc:
+            logger.error(f"Error during EnrichLessonPanel cleanup: {exc}")
         finally:
-            self.file_tree_menu.grab_release()
+            self._shell_pool.shutdown(wait=False)
+            self._analysis_pool.shutdown(wait=False)
+            self._delete_pool.shutdown(wait=False)
+            self.markdown_converter.cleanup()
+            self.parent.destroy()
     
-    def _on_file_double_click(self, event):
-        """Handle double click on a file."""
-        item_id = self.file_tree.focus()
-        if not item_id:
-            return
+    def _create_new_file(self):
+        """Create a new file in the selected directory."""
+        # Get selected directory
+        selected = self._selection()
+        parent_dir = None
         
-        # Get the file path
-        item_values = self.file_tree.item(item_id, "values")
-        if not item_values:
-            return
+        if selected:
+            item_values = self.file_tree.item(selected[0], "values")
+            if item_values and len(item_values) > 1:
+                if item_values[1] == "directory":
+                    parent_dir = item_values[0]
+                else:
+                    # If file is selected, use its parent directory
+                    parent_id = self.file_tree.parent(selected[0])
+                    if parent_id:
+                        parent_values = self.file_tree.item(parent_id, "values")
+                        if parent_values:
+                            parent_dir = parent_values[0]
         
-        file_path = item_values[0]
-        file_type = item_values[1] if len(item_values) > 1 else ""
-        
-        # Only handle files, not directories
-        if file_type != "directory":
-            # Open the file in the editor
-            self._open_file(file_path)
-    
-    def _on_file_select(self, event):
-        """Handle selection of files in the tree.
-
-        If a Markdown file is selected, load its contents into the
-        ``EnrichLessonPanel`` so the lesson appears in the "Original
-        Lesson Content" editor.
-        """
-        """Handle selection of files in the tree."""
-        selected = self.file_tree.selection()
-        if not selected:
-            return
-
-        item_values = self.file_tree.item(selected[0], "values")
-        if not item_values or len(item_values) < 2:
-            return
-
-        file_path = item_values[0]
-        file_type = item_values[1]
-
-        if file_type != "directory" and os.path.isfile(file_path):
-            if file_path.endswith(".md") or file_path.endswith(".txt"):
-                try:
-                    self.enrich_lesson.load_current_lesson(file_path)
-                except Exception as exc:
-                    logger.error(f"Failed to load lesson for enrichment: {exc}")
-    
-    def _open_file(self, file_path):
-        """Open a file in the appropriate panel."""
-        try:
-            if not os.path.isfile(file_path):
-                logger.warning(f"Cannot open non-file: {file_path}")
-                return
-                
-            # Check file extension to determine how to open it
-            ext = os.path.splitext(file_path)[1].lower()
-            
-            if ext in [".md", ".txt"]:
-                # Open in the Markdown Editor tab by default
-                self.notebook.select(self.markdown_editor_tab)
-                self.markdown_editor.open_file(file_path)
-                try:
-                    self.enrich_lesson.load_current_lesson(file_path)
-                except Exception as exc:
-                    logger.error(f"Failed to load lesson for enrichment: {exc}")
-                logger.info(f"Opened file: {file_path}")
-            else:
-                logger.warning(f"Unsupported file type: {ext}")
-                messagebox.showwarning("Unsupported File", f"Files with extension {ext} are not supported for editing.")
-        except Exception as e:
-            logger.error(f"Error opening file: {str(e)}")
-            messagebox.showerror("Error", f"Could not open file: {str(e)}")
-
-    def on_close(self) -> None:
-        """Handle closing of the main window."""
-        try:
-            if self.enrich_lesson:
-                self.enrich_lesson.cleanup()
-        except Exception as exc:
-            logger.error(f"Error during EnrichLessonPanel cleanup: {exc}")
-        finally:
-            self.parent.destroy()
-    
-    def _create_new_file(self):
-        """Create a new file in the selected directory."""
-        # Get selected directory
-        selected = self.file_tree.selection()
-        parent_dir = None
-        
-        if selected:
-            item_values = self.file_tree.item(selected[0], "values")
-            if item_values and len(item_values) > 1:
-                if item_values[1] == "directory":
-                    parent_dir = item_values[0]
-                else:
-                    # If file is selected, use its parent directory
-                    parent_id = self.file_tree.parent(selected[0])
-                    if parent_id:
-                        parent_values = self.file_tree.item(parent_id, "values")
-                        if parent_values:
-                            parent_dir = parent_values[0]
-        
-        # If no directory selected, use root
-        if not parent_dir:
-            root_id = self.file_tree.get_children()[0]  # First item should be root
-            root_values = self.file_tree.item(root_id, "values")
-            if root_values:
-                parent_dir = root_values[0]
+        # If no directory selected, use root
+        if not parent_dir:
+            root_id = self.file_tree.get_children()[0]  # First item should be root
+            root_values = self.file_tree.item(root_id, "values")
+            if root_values:
+                parent_dir = root_values[0]
         
         # Ask for filename
         if parent_dir:
@@ -952,7 +1210,7 @@ class ClaudeAIPanel(ttk.Frame):
                         f.write("# New Document\n\nStart writing here...")
                     
                     # Refresh tree and open the new file
-                    self._refresh_library()
+                    self._schedule_refresh()
                     self._open_file(file_path)
                     logger.info(f"Created new file: {file_path}")
                 except Exception as e:
@@ -962,7 +1220,7 @@ class ClaudeAIPanel(ttk.Frame):
     def _create_new_folder(self):
         """Create a new folder in the selected directory."""
         # Get selected directory (similar to _create_new_file)
-        selected = self.file_tree.selection()
+        selected = self._selection()
         parent_dir = None
         
         if selected:
@@ -995,7 +1253,7 @@ class ClaudeAIPanel(ttk.Frame):
                     os.makedirs(folder_path, exist_ok=True)
                     
                     # Refresh tree
-                    self._refresh_library()
+                    self._schedule_refresh()
                     logger.info(f"Created new folder: {folder_path}")
                 except Exception as e:
                     logger.error(f"Error creating folder {folder_path}: {str(e)}")
@@ -1003,14 +1261,13 @@ class ClaudeAIPanel(ttk.Frame):
     
     def _delete_selected(self):
         """Delete the selected files or directories."""
-        selected_items = self.file_tree.selection()
+        selected_items = self._collect_selected()
         if not selected_items:
             return
             
         # Get selected files/directories info
         items_to_delete = []
-        for item_id in selected_items:
-            item_values = self.file_tree.item(item_id, "values")
+        for item_id, item_values in selected_items:
             if not item_values:
                 continue
                 
@@ -1026,132 +1283,161 @@ class ClaudeAIPanel(ttk.Frame):
         total_files = len(items_to_delete)
         if total_files == 1:
             item_path = items_to_delete[0][0]
-            msg = f"Delete {os.path.basename(item_path)}?"
+            msg = f"Delete {_basename(item_path)}?"
         else:
             msg = f"Delete {total_files} selected items?"
             
         if not messagebox.askyesno("Confirm Deletion", msg):
             return
             
-        # Perform deletion
+        # Perform deletion off the UI thread so large folders don't freeze Tk
+        self._delete_batches += 1
+        self._delete_pool.submit(self._do_deletes, items_to_delete)
+
+    def _do_deletes(self, items_to_delete):
+        """Delete pool job that deletes the given ``(path, item_type)`` pairs."""
+        errors = []
         for path, item_type in items_to_delete:
+            # An earlier batch may already have deleted it, e.g. with its folder
+            if not os.path.lexists(path):
+                logger.info(f"Already deleted: {path}")
+                continue
             try:
                 if item_type == "directory" or os.path.isdir(path):
-                    shutil.rmtree(path)
+                    fast_rmtree(path)
                     logger.info(f"Deleted directory: {path}")
                 else:
                     os.remove(path)
                     logger.info(f"Deleted file: {path}")
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to delete {path}: {str(e)}")
+                errors.append(f"Failed to delete {path}: {str(e)}")
                 logger.error(f"Failed to delete {path}: {str(e)}")
-                
-        # Refresh the library
-        self._refresh_library()
+
+        self.parent.after(0, self._on_deletes_done)
+        if errors:
+            message = "\n".join(errors)
+            self.parent.after(0, lambda: messagebox.showerror("Error", message))
+
+    def _on_deletes_done(self):
+        """Refresh the library once every queued delete batch has finished."""
+        self._delete_batches -= 1
+        if not self._delete_batches:
+            self._schedule_refresh()
     
+    def _collect_selected(self) -> list:
+        """Fetch the values of every selected tree row in one pass.
+
+        Returns:
+            list: ``(item_id, values)`` tuples in selection order
+        """
+        item = self.file_tree.item
+        return [(item_id, item(item_id, "values")) for item_id in self._selection()]
+
+    def _selection(self):
+        """Return the file tree selection, asking Tk only after it changes.
+
+        The cached tuple is dropped on every ``<<TreeviewSelect>>`` and
+        whenever the panel changes the selection or clears the tree itself.
+        """
+        if self._selection_cache is None:
+            self._selection_cache = self.file_tree.selection()
+        return self._selection_cache
+
+    def _collect_selection(self) -> dict:
+        """Categorize the library selection in a single pass.
+
+        Returns:
+            dict: ``files``, ``md_files`` and ``dirs`` lists of selected paths
+        """
+        selection = {"files": [], "md_files": [], "dirs": []}
+        for item_id, item_values in self._collect_selected():
+            if not item_values:
+                continue
+
+            path = item_values[0]
+            item_type = item_values[1] if len(item_values) > 1 else ""
+
+            if item_type == "directory":
+                selection["dirs"].append(path)
+            elif item_type in ("file", "markdown") or os.path.isfile(path):
+                # Rows classified at insert time skip the stat call
+                selection["files"].append(path)
+                ext = item_values[2] if len(item_values) > 2 else _ext(path)
+                if ext in _MD_EXTS:
+                    selection["md_files"].append(path)
+
+        return selection
+
+    # "Send to" actions: selection category, target tab attribute, handler
+    # (dotted attribute path receiving the paths) and the empty-selection message
+    _SEND_TARGETS = {
+        "batch_edit": (
+            "files", "batch_tab", "batch_processor.prepare_batch_edit",
+            "No files were selected. Only files can be processed in batch.",
+        ),
+        "full_regen": (
+            "files", "full_regen_tab", "full_doc_regenerator.prepare_batch_edit",
+            "No files were selected. Only files can be processed in batch.",
+        ),
+        "md_splitter": (
+            "md_files", "md_splitter_tab", "_split_markdown_files",
+            "Please select at least one markdown (.md) file to split.",
+        ),
+        "md_converter": (
+            "md_files", "md_to_html_tab", "_convert_markdown_files",
+            "No valid Markdown files were selected.",
+        ),
+    }
+
+    def _dispatch_selection(self, target):
+        """Send the categorized library selection to one of the ``_SEND_TARGETS``."""
+        category, tab_name, handler_path, empty_message = self._SEND_TARGETS[target]
+
+        paths = self._collect_selection()[category]
+        if not paths:
+            messagebox.showinfo("No Files", empty_message)
+            return
+
+        handler = self
+        for attr in handler_path.split("."):
+            handler = getattr(handler, attr)
+
+        self.notebook.select(getattr(self, tab_name))
+        handler(paths)
+        logger.info(f"Sent {len(paths)} files to {target}")
+
     def _send_to_batch_edit(self):
         """Send selected files to batch edit tab."""
-        selected_items = self.file_tree.selection()
-        
-        if not selected_items:
-            messagebox.showinfo("No Selection", "Please select files to add to batch processing.")
-            return
-        
-        # Get paths for the selected items
-        selected_files = []
-        for item_id in selected_items:
-            # Get the full path from the tree view
-            full_path = self.file_tree.item(item_id, "values")[0]
-            
-            # Check if it's a file
-            if os.path.isfile(full_path):
-                selected_files.append(full_path)
-        
-        if not selected_files:
-            messagebox.showinfo("No Files", "No files were selected. Only files can be processed in batch.")
-            return
-        
-        # Send the files to the batch processor
-        self.batch_processor.prepare_batch_edit(selected_files)
-        
-        # Switch to the batch tab
-        self.notebook.select(self.batch_tab)
-        
-        # Log the action
-        logger.info(f"Sent {len(selected_files)} files to batch edit tab")
-    
+        self._dispatch_selection("batch_edit")
+
     def _send_to_full_regen(self):
         """Send selected files to the full document regeneration tab."""
-        selected_items = self.file_tree.selection()
-        
-        if not selected_items:
-            messagebox.showinfo("No Selection", "Please select files to add to full document regeneration.")
-            return
-        
-        # Get paths for the selected items
-        selected_files = []
-        for item_id in selected_items:
-            # Get the full path from the tree view
-            full_path = self.file_tree.item(item_id, "values")[0]
-            
-            # Check if it's a file
-            if os.path.isfile(full_path):
-                selected_files.append(full_path)
-        
-        if not selected_files:
-            messagebox.showinfo("No Files", "No files were selected. Only files can be processed in batch.")
-            return
-        
-        # Send the files to the full document regenerator
-        self.full_doc_regenerator.prepare_batch_edit(selected_files)
-        
-        # Switch to the full document regeneration tab
-        self.notebook.select(self.full_regen_tab)
-        
-        # Log the action
-        logger.info(f"Sent {len(selected_files)} files to full document regeneration tab")
-    
+        self._dispatch_selection("full_regen")
+
     def _send_to_md_splitter(self):
         """Send selected markdown files to the MD Splitter tab."""
-        # Check if any markdown files are selected
-        selected_markdown_files = []
-        for item_id in self.file_tree.selection():
-            item_values = self.file_tree.item(item_id, "values")
-            if item_values and len(item_values) > 1:
-                file_path = item_values[0]
-                file_type = item_values[1]
-                
-                if file_type != "directory" and os.path.isfile(file_path) and file_path.lower().endswith(".md"):
-                    selected_markdown_files.append(file_path)
-        
-        if not selected_markdown_files:
-            messagebox.showinfo("No Markdown Files", "Please select at least one markdown (.md) file to split.")
-            return
-        
-        # Switch to the splitter tab
-        self.notebook.select(self.md_splitter_tab)
-        
-        # Trigger the split process if there's only one file
-        if len(selected_markdown_files) == 1 and hasattr(self.markdown_splitter, "split_selected_files"):
-            # Set the output directory to the same as the file if not already set
-            if not self.markdown_splitter.output_dir_var.get().strip():
-                self.markdown_splitter.output_dir_var.set(os.path.dirname(selected_markdown_files[0]))
-            
-            # Call the split function
-            self.markdown_splitter.split_selected_files()
-    
+        self._dispatch_selection("md_splitter")
+
     def _send_to_md_converter(self):
         """Send selected markdown files to the MD to HTML converter tab."""
-        # First switch to the MD to HTML tab
-        self.notebook.select(self.md_to_html_tab)
-        
-        # Then trigger the conversion
+        self._dispatch_selection("md_converter")
+
+    def _split_markdown_files(self, md_files):
+        """Trigger the split right away when a single markdown file is sent."""
+        if len(md_files) != 1:
+            return
+        if not self.markdown_splitter.output_dir_var.get().strip():
+            self.markdown_splitter.output_dir_var.set(os.path.dirname(md_files[0]))
+        self.markdown_splitter.split_selected_files()
+
+    def _convert_markdown_files(self, md_files):
+        """Load the selected markdown files into the MD to HTML converter."""
         if hasattr(self.markdown_converter, "convert_selected_files"):
             self.markdown_converter.convert_selected_files()
         else:
             logger.error("Markdown Converter doesn't have convert_selected_files method")
             messagebox.showerror("Error", "Unable to convert files - Markdown Converter not properly initialized")
-            
+
     def _send_to_file_renamer(self):
         """Send selected markdown files to the File Renamer tab for standardizing filenames."""
         # First switch to the File Renamer tab
@@ -1230,7 +1516,12 @@ class ClaudeAIPanel(ttk.Frame):
         ).start()
     
     def _run_text_editor_tool_thread(self, edit_instructions, files, context=""):
-        """Thread function for running the text editor tool"""
+        """Thread function for running the text editor tool.
+
+        Results are forwarded to the UI one at a time as the batch processor
+        yields them, so progress shows immediately and finished results are
+        not held until the whole batch completes.
+        """
         try:
             # Call the batch processor's edit_files_with_text_editor method
             results = self.batch_processor.edit_files_with_text_editor(
@@ -1239,18 +1530,28 @@ class ClaudeAIPanel(ttk.Frame):
                 context=context
             )
             
+            count = 0
+            for result in results:
+                count += 1
+                self.parent.after(0, self._append_text_editor_result, result, count, len(files))
+            
             # Update UI when done
-            self.parent.after(100, lambda: self._text_editor_tool_complete(results))
+            self.parent.after(0, self._text_editor_tool_complete, count)
             
         except Exception as e:
             logger.error(f"Error in text editor tool thread: {str(e)}")
             self.parent.after(100, lambda: self._text_editor_tool_error(str(e)))
+
+    def _append_text_editor_result(self, result, count, total):
+        """Called on the UI thread for each file the text editor tool finishes"""
+        logger.debug(f"Text editor tool result {count}/{total}: {result}")
+        self.update_status(f"Text editor tool processed {count} of {total} files...")
     
-    def _text_editor_tool_complete(self, results):
+    def _text_editor_tool_complete(self, count):
         """Called when text editor tool processing is complete"""
         self.processing_batch = False
         self.batch_processor.cancel_batch_button.config(state="disabled")
-        self.update_status(f"Text editor tool completed processing {len(results)} files")
+        self.update_status(f"Text editor tool completed processing {count} files")
         
     def _text_editor_tool_error(self, error_msg):
         """Called when text editor tool processing encounters an error"""
@@ -1263,8 +1564,6 @@ class ClaudeAIPanel(ttk.Frame):
         """
         Toggle the use of local cache based on user preference
         """
-        from cache_utils import set_local_cache_enabled
-        
         # Get the current setting
         use_local_cache = self.use_local_cache_var.get()
         
@@ -1293,9 +1592,27 @@ class ClaudeAIPanel(ttk.Frame):
         # If we're running in a main app with a status bar, update it
         if hasattr(self.main_app, 'status_bar') and self.main_app.status_bar:
             self.main_app.status_bar.config(text=message)
-            self.main_app.update_idletasks()
+            # Redraw once per idle cycle rather than once per message
+            if not self._status_flush_pending:
+                self._status_flush_pending = True
+                self.main_app.after_idle(self._flush_status)
+
+    def _flush_status(self):
+        """Flush pending status bar redraws queued by ``update_status``."""
+        self._status_flush_pending = False
+        self.main_app.update_idletasks()
 
     def _setup_selected_text_analysis(self):
+        """Defer the selected-text analysis UI until the AI Detection tab is shown."""
+        self.selected_text_widget = None
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
+
+    def _on_tab_changed(self, event):
+        """Build the selected-text analysis UI the first time its tab is selected."""
+        if self.selected_text_widget is None and self.notebook.select() == str(self.ai_detect_tab):
+            self._build_selected_text_analysis()
+
+    def _build_selected_text_analysis(self):
         """Add UI elements for analyzing selected text for AI writing patterns."""
         # Create a frame for selected text analysis in the AI detection tab
         selected_text_frame = ttk.LabelFrame(self.ai_detect_tab, text="Analyze Selected Text")
@@ -1333,8 +1650,15 @@ class ClaudeAIPanel(ttk.Frame):
         text_widget_frame = ttk.Frame(text_frame)
         text_widget_frame.pack(fill="both", expand=True, padx=5, pady=5)
         
-        self.selected_text_widget = scrolledtext.ScrolledText(text_widget_frame, wrap=tk.WORD, height=10)
+        # Plain Text plus a sibling scrollbar avoids ScrolledText's extra frame
+        text_scrollbar = ttk.Scrollbar(text_widget_frame, orient="vertical")
+        text_scrollbar.pack(side="right", fill="y")
+        self.selected_text_widget = tk.Text(
+            text_widget_frame, wrap=tk.WORD, height=10,
+            yscrollcommand=text_scrollbar.set
+        )
         self.selected_text_widget.pack(side="left", fill="both", expand=True)
+        text_scrollbar.config(command=self.selected_text_widget.yview)
         
         # Create buttons frame
         buttons_frame = ttk.Frame(selected_text_frame)
@@ -1347,21 +1671,36 @@ class ClaudeAIPanel(ttk.Frame):
         
         # Add clear button
         clear_btn = ttk.Button(buttons_frame, text="Clear", 
-                            command=lambda: self.selected_text_widget.delete(1.0, tk.END))
+                            command=self._clear_selected_text)
         clear_btn.pack(side="left", padx=5, pady=5)
         
         # Add info label
         info_label = ttk.Label(buttons_frame, 
                              text="Analyzes text for AI writing patterns and generates a report")
         info_label.pack(side="left", padx=10, pady=5)
+        
+        # The widget is built after the context menus were bound, so bind it now
+        self._bind_context_menu_to_text_widget(self.selected_text_widget)
+    
+    def _clear_selected_text(self):
+        """Clear the text entered for analysis."""
+        self.selected_text_widget.delete("1.0", "end")
     
     def _analyze_current_text(self):
         """Analyze the text currently in the selected text widget."""
-        # Get the text from the widget
-        selected_text = self.selected_text_widget.get(1.0, tk.END)
+        if self.selected_text_widget is None:
+            return
+        
+        # An empty widget ends at 1.0; skip copying the buffer out of Tk
+        if self.selected_text_widget.index("end-1c") == "1.0":
+            messagebox.showinfo("No Text Entered", "Please enter or paste some text to analyze first.")
+            return
+        
+        # Get the text from the widget, without Tk's trailing newline
+        selected_text = self.selected_text_widget.get("1.0", "end-1c")
         
         # Pass to the AI detector for analysis
-        self.ai_detector.analyze_selected_text(selected_text)
+        self._submit_text_analysis(selected_text)
     
     def _analyze_editor_selection(self):
         """Analyze text selected in any active editor tab."""
@@ -1370,45 +1709,114 @@ class ClaudeAIPanel(ttk.Frame):
         
         if selected_text:
             # Pass to the AI detector for analysis
-            self.ai_detector.analyze_selected_text(selected_text)
+            self._submit_text_analysis(selected_text)
         else:
             messagebox.showinfo("No Text Selected", "Please select some text in an editor tab first.")
+
+    def _submit_text_analysis(self, selected_text):
+        """Detect AI writing patterns on the analysis worker, then show the report.
+
+        Args:
+            selected_text: The text to analyze
+        """
+        if not self.ai_detector.has_text_to_analyze(selected_text):
+            return
+        
+        future = self._analysis_pool.submit(self.ai_detector.detect_selected_text, selected_text)
+        # Report widgets must be built on the Tk thread
+        future.add_done_callback(lambda f: self.after(0, self._on_analysis_done, f))
+
+    def _on_analysis_done(self, future):
+        """Show the report for a finished ``_submit_text_analysis`` job."""
+        try:
+            self.ai_detector.show_selected_text_report(future.result())
+        except Exception as e:
+            self.ai_detector.report_selected_text_error(e)
     
     def _get_selected_text_from_active_editor(self):
         """Get selected text from the currently active editor tab."""
+        active_tab = self.notebook.select()
+        
         # Check if we're in markdown editor tab
-        if self.notebook.select() == str(self.markdown_editor_tab):
+        if active_tab == self._markdown_editor_tab_path:
             if hasattr(self.markdown_editor, "text_editor") and self.markdown_editor.text_editor:
                 try:
-                    return self.markdown_editor.text_editor.get(tk.SEL_FIRST, tk.SEL_LAST)
+                    return self.markdown_editor.text_editor.get(_SEL_FIRST, _SEL_LAST)
                 except tk.TclError:
                     # No selection
                     pass
         
+        # The focused widget almost always owns the selection
+        focused = self.focus_get()
+        if isinstance(focused, _TEXT_WIDGET_TYPES):
+            try:
+                return focused.get(_SEL_FIRST, _SEL_LAST)
+            except tk.TclError:
+                pass
+        
         # Try to get selection from other text widgets in active tab
-        active_tab = self.notebook.select()
         if active_tab:
-            active_frame = self.notebook.nametowidget(active_tab)
-            for widget in self._find_all_text_widgets(active_frame):
+            widgets = self._text_widget_cache.get(active_tab)
+            if widgets is not None:
+                for widget in widgets:
+                    try:
+                        # Skip widgets destroyed since the tab was walked
+                        if widget.winfo_exists():
+                            return widget.get(_SEL_FIRST, _SEL_LAST)
+                    except (tk.TclError, AttributeError):
+                        # No selection or not a text widget with selection capability
+                        continue
+
+            # No cached widget has a selection, and text widgets may have been
+            # created or replaced since the walk, so walk the tab again. Stop at
+            # the first selection; only a completed walk is cached, so a
+            # partial list is never reused.
+            active_frame = (
+                self._tab_frames_by_path.get(active_tab)
+                or self.notebook.nametowidget(active_tab)
+            )
+            if active_tab not in self._text_widget_cache_bound:
+                # Layout changes (widgets added/removed) invalidate the entry
+                active_frame.bind(
+                    "<Configure>",
+                    lambda e, tab=active_tab: self._text_widget_cache.pop(tab, None),
+                    add="+"
+                )
+                self._text_widget_cache_bound.add(active_tab)
+            widgets = []
+            for widget in self._iter_text_widgets(active_frame):
+                widgets.append(widget)
                 try:
-                    return widget.get(tk.SEL_FIRST, tk.SEL_LAST)
+                    return widget.get(_SEL_FIRST, _SEL_LAST)
                 except (tk.TclError, AttributeError):
                     # No selection or not a text widget with selection capability
                     continue
+            self._text_widget_cache[active_tab] = widgets
         
         return None
     
-    def _find_all_text_widgets(self, parent):
-        """Recursively find all text widgets in a parent widget."""
-        text_widgets = []
-        
-        for widget in parent.winfo_children():
-            if isinstance(widget, (tk.Text, scrolledtext.ScrolledText)):
-                text_widgets.append(widget)
-            elif widget.winfo_children():
-                text_widgets.extend(self._find_all_text_widgets(widget))
+    def _iter_text_widgets(self, parent):
+        """Yield the text widgets below a parent widget as they are found.
+
+        Walks the tree depth-first with an explicit stack so each widget's
+        children are fetched from Tk exactly once, and callers can stop early.
+        """
+        text_types = _TEXT_WIDGET_TYPES
+        stack = [parent]
         
-        return text_widgets
+        while stack:
+            for widget in stack.pop().winfo_children():
+                if isinstance(widget, text_types):
+                    yield widget
+                else:
+                    stack.append(widget)
+
+    def _find_all_text_widgets(self, parent):
+        """Find all text widgets below a parent widget."""
+        return list(self._iter_text_widgets(parent))
+
+    # Tree row types that count as files for get_selected_files
+    _FILE_TYPES = frozenset({"file", "markdown"})
 
     def get_selected_files(self) -> list:
         """Get paths of files selected in the library panel
@@ -1416,584 +1824,15 @@ class ClaudeAIPanel(ttk.Frame):
         Returns:
             list: List of absolute paths to the selected files
         """
-        selected_items = self.file_tree.selection()
-        selected_files = []
-        
-        for item_id in selected_items:
-            # Get the item's values
-            item_values = self.file_tree.item(item_id, "values")
-            if item_values and len(item_values) >= 2:
-                path = item_values[0]
-                item_type = item_values[1]
-                
-                # Only add files, not directories
-                if item_type.lower() in ["file", "markdown"]:
-                    selected_files.append(path)
-                elif os.path.isfile(path):  # Fallback check if it's actually a file
-                    selected_files.append(path)
+        file_types = self._FILE_TYPES
+        selected_files = [
+            item_values[0]
+            for item_id, item_values in self._collect_selected()
+            if len(item_values) >= 2 and item_values[1].lower() in file_types
+        ]
         
         # Store the selected files as an instance variable for other components to access
         self.selected_files = selected_files
         
         logger.info(f"Get selected files from library: {len(selected_files)} files selected")
         return selected_files
-
-    def _open_file_in_editor(self):
-        """Open the selected file in the markdown editor."""
-        selected_items = self.file_tree.selection()
-        
-        if not selected_items:
-            return
-        
-        for item_id in selected_items:
-            item_values = self.file_tree.item(item_id, 'values')
-            
-            if not item_values or len(item_values) < 2:
-                continue
-            
-            file_path = item_values[0]
-            item_type = item_values[1]
-            
-            if item_type == "file" and os.path.isfile(file_path):
-                # If it's a markdown file, open it in the editor
-                if file_path.endswith(".md") or file_path.endswith(".txt"):
-                    # Switch to the markdown editor tab
-                    self.notebook.select(self.markdown_editor_tab)
-                    
-                    # Tell the markdown editor to open the file
-                    self.markdown_editor.open_file(file_path)
-                    
-                    logger.info(f"Opened file in markdown editor: {file_path}")
-                    break
-                else:
-                    # Try to open in system editor
-                    self._open_in_system_editor()
-    
-    def _open_in_system_editor(self):
-        """Open the selected file in the system's default editor."""
-        selected_items = self.file_tree.selection()
-        if not selected_items:
-            return
-            
-        for item_id in selected_items:
-            item_values = self.file_tree.item(item_id, "values")
-            if not item_values or len(item_values) < 2:
-                continue
-                
-            file_path = item_values[0]
-            item_type = item_values[1]
-            
-            # Only open files, not directories
-            if item_type != "directory" and os.path.isfile(file_path):
-                try:
-                    # Use the system's default application to open the file
-                    os.startfile(file_path)
-                    logger.info(f"Opened file in system editor: {file_path}")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to open file: {str(e)}")
-                    logger.error(f"Failed to open file in system editor: {str(e)}")
-    
-    def _rename_selected(self):
-        """Rename the selected file or directory."""
-        selected_items = self.file_tree.selection()
-        if not selected_items:
-            return
-            
-        # Get the selected item
-        item_id = selected_items[0]  # Only rename one at a time
-        item_values = self.file_tree.item(item_id, "values")
-        if not item_values or len(item_values) < 2:
-            return
-            
-        path = item_values[0]
-        item_type = item_values[1]
-        
-        # Get current name and ask for new name
-        current_name = os.path.basename(path)
-        parent_dir = os.path.dirname(path)
-        
-        new_name = simpledialog.askstring("Rename", "Enter new name:", initialvalue=current_name)
-        if not new_name or new_name == current_name:
-            return
-            
-        # Create full new path
-        new_path = os.path.join(parent_dir, new_name)
-        
-        # Check if target already exists
-        if os.path.exists(new_path):
-            messagebox.showerror("Error", f"Cannot rename: {new_name} already exists.")
-            return
-            
-        try:
-            # Rename the file or directory
-            os.rename(path, new_path)
-            logger.info(f"Renamed {path} to {new_path}")
-            
-            # Refresh tree
-            self._refresh_library()
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to rename: {str(e)}")
-            logger.error(f"Failed to rename {path}: {str(e)}")
-    
-    def _show_in_explorer(self):
-        """Show the selected file or directory in Windows Explorer."""
-        selected_items = self.file_tree.selection()
-        if not selected_items:
-            return
-            
-        for item_id in selected_items:
-            item_values = self.file_tree.item(item_id, "values")
-            if not item_values:
-                continue
-                
-            path = item_values[0]
-            
-            try:
-                # If it's a file, select it in Explorer
-                if os.path.isfile(path):
-                    # Open explorer and select the file
-                    subprocess.run(["explorer", "/select,", path])
-                else:
-                    # Open the directory
-                    os.startfile(path)
-                    
-                logger.info(f"Opened in Explorer: {path}")
-                break  # Only show one item
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to open in Explorer: {str(e)}")
-                logger.error(f"Failed to open in Explorer: {str(e)}")
-
-
-            item_type = item_values[1]
-            
-            # Only add files, not directories
-            if item_type != "directory" and os.path.isfile(path):
-                regen_files.append(path)
-                
-        if not regen_files:
-            messagebox.showinfo("No Files", "No valid files were selected.")
-            return
-            
-        # Switch to full regeneration tab
-        self.notebook.select(self.full_regen_tab)
-        
-        # Update full document regenerator with the files
-        if hasattr(self, "full_doc_regenerator"):
-            self.full_doc_regenerator.set_file_list(regen_files)
-            
-        logger.info(f"Sent {len(regen_files)} files to full document regeneration")
-    
-    def _send_to_md_splitter(self):
-        """Send selected files to the markdown splitter tab."""
-        selected_items = self.file_tree.selection()
-        if not selected_items:
-            messagebox.showinfo("No Selection", "Please select a file to split.")
-            return
-            
-        # Get the selected markdown file (only process the first one)
-        item_id = selected_items[0]  # Only send one file at a time
-        item_values = self.file_tree.item(item_id, "values")
-        if not item_values or len(item_values) < 2:
-            return
-            
-        path = item_values[0]
-        item_type = item_values[1]
-        
-        # Verify it's a markdown file
-        if item_type != "directory" and os.path.isfile(path) and path.lower().endswith((".md", ".markdown")):
-            # Switch to markdown splitter tab
-            self.notebook.select(self.md_splitter_tab)
-            
-            # Set the file in the markdown splitter
-            if hasattr(self, "md_splitter"):
-                self.md_splitter.set_input_file(path)
-                
-            logger.info(f"Sent file to markdown splitter: {path}")
-        else:
-            messagebox.showinfo("Invalid File", "Please select a Markdown file (.md, .markdown).")
-    
-    def _send_to_md_converter(self):
-        """Send selected files to the markdown converter tab."""
-        selected_items = self.file_tree.selection()
-        if not selected_items:
-            messagebox.showinfo("No Selection", "Please select files to convert.")
-            return
-            
-        # Get paths of selected markdown files
-        md_files = []
-        for item_id in selected_items:
-            item_values = self.file_tree.item(item_id, "values")
-            if not item_values or len(item_values) < 2:
-                continue
-                
-            path = item_values[0]
-            item_type = item_values[1]
-            
-            # Only add markdown files
-            if item_type != "directory" and os.path.isfile(path) and path.lower().endswith((".md", ".markdown")):
-                md_files.append(path)
-                
-        if not md_files:
-            messagebox.showinfo("No Files", "No valid Markdown files were selected.")
-            return
-            
-        # Switch to markdown converter tab
-        self.notebook.select(self.md_to_html_tab)
-        
-        # Update markdown converter with the files
-        if hasattr(self, "md_converter"):
-            self.md_converter.set_input_files(md_files)
-            
-        logger.info(f"Sent {len(md_files)} files to markdown converter")
-
-    def _open_in_system_editor(self):
-        """Open the selected file in the system's default editor."""
-        selected_items = self.file_tree.selection()
-        if not selected_items:
-            return
-            
-        for item_id in selected_items:
-            item_values = self.file_tree.item(item_id, "values")
-            if not item_values or len(item_values) < 2:
-                continue
-                
-            file_path = item_values[0]
-            item_type = item_values[1]
-            
-            # Only open files, not directories
-            if item_type != "directory" and os.path.isfile(file_path):
-                try:
-                    # Use the system's default application to open the file
-                    os.startfile(file_path)
-                    logger.info(f"Opened file in system editor: {file_path}")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to open file: {str(e)}")
-                    logger.error(f"Failed to open file in system editor: {str(e)}")
-    
-    def _rename_selected(self):
-        """Rename the selected file or directory."""
-        selected_items = self.file_tree.selection()
-        if not selected_items:
-            return
-            
-        # Get the selected item
-        item_id = selected_items[0]  # Only rename one at a time
-        item_values = self.file_tree.item(item_id, "values")
-        if not item_values or len(item_values) < 2:
-            return
-            
-        path = item_values[0]
-        item_type = item_values[1]
-        
-        # Get current name and ask for new name
-        current_name = os.path.basename(path)
-        parent_dir = os.path.dirname(path)
-        
-        new_name = simpledialog.askstring("Rename", "Enter new name:", initialvalue=current_name)
-        if not new_name or new_name == current_name:
-            return
-            
-        # Create full new path
-        new_path = os.path.join(parent_dir, new_name)
-        
-        # Check if target already exists
-        if os.path.exists(new_path):
-            messagebox.showerror("Error", f"Cannot rename: {new_name} already exists.")
-            return
-            
-        try:
-            # Rename the file or directory
-            os.rename(path, new_path)
-            logger.info(f"Renamed {path} to {new_path}")
-            
-            # Refresh tree
-            self._refresh_library()
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to rename: {str(e)}")
-            logger.error(f"Failed to rename {path}: {str(e)}")
-    
-    def _show_in_explorer(self):
-        """Show the selected file or directory in Windows Explorer."""
-        selected_items = self.file_tree.selection()
-        if not selected_items:
-            return
-            
-        for item_id in selected_items:
-            item_values = self.file_tree.item(item_id, "values")
-            if not item_values:
-                continue
-                
-            path = item_values[0]
-            
-            try:
-                # If it's a file, select it in Explorer
-                if os.path.isfile(path):
-                    # Open explorer and select the file
-                    subprocess.run(["explorer", "/select,", path])
-                else:
-                    # Open the directory
-                    os.startfile(path)
-                    
-                logger.info(f"Opened in Explorer: {path}")
-                break  # Only show one item
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to open in Explorer: {str(e)}")
-                logger.error(f"Failed to open in Explorer: {str(e)}")
-
-    def _open_selected_file(self):
-        """Open the selected file in the markdown editor."""
-        selected_items = self.file_tree.selection()
-        
-        if not selected_items:
-            return
-        
-        for item_id in selected_items:
-            item_values = self.file_tree.item(item_id, 'values')
-            
-            if not item_values or len(item_values) < 2:
-                continue
-            
-            file_path = item_values[0]
-            item_type = item_values[1]
-            
-            if item_type == "file" and os.path.isfile(file_path):
-                # If it's a markdown file, open it in the editor
-                if file_path.endswith(".md") or file_path.endswith(".txt"):
-                    # Switch to the markdown editor tab
-                    self.notebook.select(self.markdown_editor_tab)
-                    
-                    # Tell the markdown editor to open the file
-                    self.markdown_editor.open_file(file_path)
-                    
-                    logger.info(f"Opened file in markdown editor: {file_path}")
-                    break
-                else:
-                    # Try to open in system editor
-                    self._open_in_system_editor()
-    
-    def _on_file_double_click(self, event):
-        """Handle double click on a file."""
-        item_id = self.file_tree.focus()
-        if not item_id:
-            return
-        
-        # Get the file path
-        item_values = self.file_tree.item(item_id, "values")
-        if not item_values:
-            return
-        
-        file_path = item_values[0]
-        file_type = item_values[1] if len(item_values) > 1 else ""
-        
-        # Only handle files, not directories
-        if file_type != "directory":
-            # Open the file in the editor
-            self._open_file(file_path)
-    
-    def _on_file_select(self, event):
-        """Load the selected file into the Enrich Lesson panel."""
-        selected = self.file_tree.selection()
-        if not selected:
-            return
-
-        item_id = selected[0]
-        item_values = self.file_tree.item(item_id, "values")
-        if not item_values:
-            return
-
-        path = item_values[0]
-        try:
-            self.enrich_lesson.load_current_lesson(path)
-        except Exception as exc:
-            logger.error(f"Failed to load lesson for enrichment: {exc}")
-    
-    def _open_file(self, file_path):
-        """Open a file in the appropriate panel."""
-        try:
-            if not os.path.isfile(file_path):
-                logger.warning(f"Cannot open non-file: {file_path}")
-                return
-                
-            # Check file extension to determine how to open it
-            ext = os.path.splitext(file_path)[1].lower()
-            
-            if ext in [".md", ".txt"]:
-                # Open in the Markdown Editor tab by default
-                self.notebook.select(self.markdown_editor_tab)
-                self.markdown_editor.open_file(file_path)
-                try:
-                    # Also load the lesson into the Enrich panel so the
-                    # "Original Lesson Content" editor shows the file
-                    # contents immediately upon opening.
-                    self.enrich_lesson.load_current_lesson(file_path)
-                except Exception as exc:
-                    logger.error(
-                        f"Failed to load lesson for enrichment: {exc}",
-                    )
-                logger.info(f"Opened file: {file_path}")
-            else:
-                logger.warning(f"Unsupported file type: {ext}")
-                messagebox.showwarning("Unsupported File", f"Files with extension {ext} are not supported for editing.")
-        except Exception as e:
-            logger.error(f"Error opening file: {str(e)}")
-            messagebox.showerror("Error", f"Could not open file: {str(e)}")
-    
-    def _open_in_system_editor(self):
-        """Open the selected file in the system's default editor."""
-        selected_items = self.file_tree.selection()
-        if not selected_items:
-            return
-            
-        for item_id in selected_items:
-            item_values = self.file_tree.item(item_id, "values")
-            if not item_values or len(item_values) < 2:
-                continue
-                
-            file_path = item_values[0]
-            item_type = item_values[1]
-            
-            # Only open files, not directories
-            if item_type != "directory" and os.path.isfile(file_path):
-                try:
-                    # Use the system's default application to open the file
-                    os.startfile(file_path)
-                    logger.info(f"Opened file in system editor: {file_path}")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to open file: {str(e)}")
-                    logger.error(f"Failed to open file in system editor: {str(e)}")
-    
-    def _show_in_explorer(self):
-        """Show the selected file or directory in Windows Explorer."""
-        selected_items = self.file_tree.selection()
-        if not selected_items:
-            return
-            
-        for item_id in selected_items:
-            item_values = self.file_tree.item(item_id, "values")
-            if not item_values:
-                continue
-                
-            path = item_values[0]
-            
-            try:
-                # If it's a file, select it in Explorer
-                if os.path.isfile(path):
-                    # Open explorer and select the file
-                    subprocess.run(["explorer", "/select,", path])
-                else:
-                    # Open the directory
-                    os.startfile(path)
-                    
-                logger.info(f"Opened in Explorer: {path}")
-                break  # Only show one item
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to open in Explorer: {str(e)}")
-                logger.error(f"Failed to open in Explorer: {str(e)}")
-    
-    def _show_file_tree_context_menu(self, event):
-        """Show the context menu for the file tree."""
-        # Select the item under cursor
-        item = self.file_tree.identify_row(event.y)
-        if item:
-            # If clicking on a new item, select it
-            if item not in self.file_tree.selection():
-                self.file_tree.selection_set(item)
-            
-            # Show the context menu
-            self.file_tree_menu.post(event.x_root, event.y_root)
-    
-    def _open_selected_file(self):
-        """Open the selected file in the markdown editor."""
-        selected_items = self.file_tree.selection()
-        
-        if not selected_items:
-            return
-        
-        for item_id in selected_items:
-            item_values = self.file_tree.item(item_id, 'values')
-            
-            if not item_values or len(item_values) < 2:
-                continue
-            
-            file_path = item_values[0]
-            item_type = item_values[1]
-            
-            if item_type == "file" and os.path.isfile(file_path):
-                # If it's a markdown file, open it in the editor
-                if file_path.endswith(".md") or file_path.endswith(".txt"):
-                    # Switch to the markdown editor tab
-                    self.notebook.select(self.markdown_editor_tab)
-                    
-                    # Tell the markdown editor to open the file
-                    self.markdown_editor.open_file(file_path)
-                    
-                    logger.info(f"Opened file in markdown editor: {file_path}")
-                    break
-                else:
-                    # Try to open in system editor
-                    self._open_in_system_editor()
-    
-    def _on_file_double_click(self, event):
-        """Handle double click on a file."""
-        item_id = self.file_tree.focus()
-        if not item_id:
-            return
-        
-        # Get the file path
-        item_values = self.file_tree.item(item_id, "values")
-        if not item_values:
-            return
-        
-        file_path = item_values[0]
-        file_type = item_values[1] if len(item_values) > 1 else ""
-        
-        # Only handle files, not directories
-        if file_type != "directory":
-            # Open the file in the editor
-            self._open_file(file_path)
-    
-    def _on_file_select(self, event):
-        """Load the selected file into the Enrich Lesson panel."""
-        selected = self.file_tree.selection()
-        if not selected:
-            return
-
-        item_id = selected[0]
-        item_values = self.file_tree.item(item_id, "values")
-        if not item_values:
-            return
-
-        path = item_values[0]
-        try:
-            self.enrich_lesson.load_current_lesson(path)
-        except Exception as exc:
-            logger.error(f"Failed to load lesson for enrichment: {exc}")
-    
-    def _open_file(self, file_path):
-        """Open a file in the appropriate panel."""
-        try:
-            if not os.path.isfile(file_path):
-                logger.warning(f"Cannot open non-file: {file_path}")
-                return
-                
-            # Check file extension to determine how to open it
-            ext = os.path.splitext(file_path)[1].lower()
-            
-            if ext in [".md", ".txt"]:
-                # Open in the Markdown Editor tab by default
-                self.notebook.select(self.markdown_editor_tab)
-                self.markdown_editor.open_file(file_path)
-                try:
-                    # Keep Enrich Lesson panel in sync when files are opened
-                    self.enrich_lesson.load_current_lesson(file_path)
-                except Exception as exc:
-                    logger.error(
-                        f"Failed to load lesson for enrichment: {exc}",
-                    )
-                logger.info(f"Opened file: {file_path}")
-            else:
-                logger.warning(f"Unsupported file type: {ext}")
-                messagebox.showwarning("Unsupported File", f"Files with extension {ext} are not supported for editing.")
-        except Exception as e:
-            logger.error(f"Error opening file: {str(e)}")
-            messagebox.showerror("Error", f"Could not open file: {str(e)}")
@@ -2,53 +2,224 @@
 
 import os
 import re
+import html
 import sys
+import shutil
 import logging
+import subprocess
 import threading
+import multiprocessing
+import concurrent.futures
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import queue
 import traceback
+import mmap
+from functools import lru_cache
+from hashlib import blake2b
+from pathlib import Path
 
 # Import markdown library for conversion
 try:
     import markdown
 except ImportError:
     logging.error("markdown library not found, attempting to install it")
-    import subprocess
     subprocess.run([sys.executable, "-m", "pip", "install", "markdown"])
     import markdown
 
 # Get logger
 logger = logging.getLogger("output_library_editor")
 
+# Open a file with the platform's default application, chosen once at import.
+# Launchers are started without waiting so a batch doesn't block on each one.
+if sys.platform == 'win32':
+    _open_with_default_app = os.startfile
+else:
+    _OPEN_COMMAND = 'open' if sys.platform == 'darwin' else 'xdg-open'
+
+    def _open_with_default_app(path):
+        subprocess.Popen([_OPEN_COMMAND, path])
+
+# Patterns used by the conversion pipeline, compiled once at import
+_HEADING_RE = re.compile(r'^\s*#\s+(.*?)\s*$', re.MULTILINE)
+# Opening tags allow attributes (e.g. ids from ``{#id}`` attribute lists)
+_H1_RE = re.compile(r'(<h1[^>]*>)(.*?)</h1>')
+_H2_LEARNING_RE = re.compile(
+    r'(<h2[^>]*>)(\s*Learning\s*Objectives\s*)(</h2>\s*)(<p>)(.*?)(</p>)(\s*<ul>)(.*?)(</ul>)',
+    re.DOTALL | re.IGNORECASE
+)
+_H2_LEARNING_SIMPLE_RE = re.compile(r'(<h2[^>]*>)(\s*Learning\s*Objectives\s*)</h2>', re.IGNORECASE)
+_LI_STYLE_RE = re.compile(r'(<li[^>]*>)(.*?)(</li>)')
+_LI_STYLE = r'\1\n    <span style="color:#920205;">\2</span>\n\3'
+_KEY_TAKEAWAYS_HEADING_RE = re.compile(r'#+\s*Key\s*Takeaways\s*.*?\n', re.IGNORECASE)
+# Heading lines and the first audio URL on each other line of an audio section
+_AUDIO_TITLE_RE = re.compile(r'^#+[^\S\n]*(.*)$', re.MULTILINE)
+_AUDIO_LINE_URL_RE = re.compile(r'^(?!#)[^\n]*?(https?://[^\s<>"]+\.(?:mp3|wav|ogg))', re.MULTILINE)
+
+# Triple-dash sections replaced with HTML before the markdown conversion,
+# matched in one pass and told apart by the outer group name. The body is
+# consumed a line at a time, checking for the end marker only at newlines;
+# a missing end marker runs the section to the end of the document.
+def _triple_dash_pattern(name: str, marker: str) -> str:
+    """Build the pattern for one triple-dash section."""
+    end = rf'\s*---{marker}END---'
+    return (
+        rf'(?P<{name}>(?:\n|^)\s*---{marker}---\s*(?:\n|$)'
+        rf'(?P<{name}_body>[^\n]*(?:\n(?!{end}|\Z)[^\n]*)*)(?:\n{end}|$))'
+    )
+
+
+_TRIPLE_DASH_RE = re.compile(
+    "|".join([
+        _triple_dash_pattern("audio", "audioinstructions"),
+        _triple_dash_pattern("reflect", "stopandreflect"),
+        _triple_dash_pattern("takeaways", "keytakeaways"),
+    ]),
+    # The markers are ASCII, so ASCII-only case folding and classes suffice
+    re.IGNORECASE | re.ASCII
+)
+_TRIPLE_DASH_MARKERS = ('---audioinstructions---', '---stopandreflect---', '---keytakeaways---')
+
+# Special sections lifted out before markdown conversion, in extraction order:
+# (section type, placeholder tag, literal the pattern needs, pattern whose
+# first group is the section body)
+_SPECIAL_SECTIONS = [
+    ("stop_reflect", "STOP_REFLECT", "#", re.compile(
+        r'(?:\n|^)\s*#{1,3}\s*Stop and Reflect\s*#{0,3}\s*(?:\n|$)(.*?)(?:(?:\n|^)\s*#{1,3}|$)',
+        re.DOTALL | re.IGNORECASE)),
+    ("stop_reflect", "STOP_REFLECT_DASH", "---", re.compile(
+        r'(?:\n|^)\s*---stopandreflect---\s*(?:\n|$)(.*?)(?:(?:\n|^)\s*---stopandreflectEND---|$)',
+        re.DOTALL | re.IGNORECASE)),
+    ("key_takeaways", "KEY_TAKEAWAYS", "#", re.compile(
+        r'(?:\n|^)\s*#{1,3}\s*Key Takeaways\s*#{0,3}\s*(?:\n|$)(.*?)(?:(?:\n|^)\s*#{1,3}|$)',
+        re.DOTALL | re.IGNORECASE)),
+    ("key_takeaways", "KEY_TAKEAWAYS_DASH", "---", re.compile(
+        r'(?:\n|^)\s*---keytakeaways---\s*(?:\n|$)(.*?)(?:(?:\n|^)\s*---keytakeawaysEND---|$)',
+        re.DOTALL | re.IGNORECASE)),
+    ("audio_instructions", "AUDIO_INSTRUCTIONS", "#", re.compile(
+        r'(?:\n|^)\s*#{1,3}\s*Audio Instructions\s*#{0,3}\s*(?:\n|$)(.*?)(?:(?:\n|^)\s*#{1,3}|$)',
+        re.DOTALL | re.IGNORECASE)),
+    ("audio_instructions", "AUDIO_INSTRUCTIONS_DASH", "---", re.compile(
+        r'(?:\n|^)\s*---audioinstructions---\s*(?:\n|$)(.*?)(?:(?:\n|^)\s*---audioinstructionsEND---|$)',
+        re.DOTALL | re.IGNORECASE)),
+]
+# Lower-cased literals every special section or Learning Objectives heading
+# contains; documents with none of them take the plain conversion path
+_SPECIAL_MARKERS = (
+    'stop and reflect', 'stopandreflect',
+    'key takeaways', 'keytakeaways',
+    'audio instructions', 'audioinstructions',
+    'objectives',
+)
+_PLACEHOLDER_RE = re.compile(r'<!-- SPECIAL_SECTION_[A-Z_]+_\d+ -->')
+
 
 class LoggingHandler(logging.Handler):
     """Custom logging handler that redirects logs to the GUI"""
     
+    # Records logged within this many milliseconds are shown together
+    FLUSH_DELAY_MS = 50
+    
     def __init__(self, text_widget):
         logging.Handler.__init__(self)
         self.text_widget = text_widget
         self.log_queue = queue.Queue()
-        self.text_widget.after(100, self.poll_log_queue)
+        self._flush_lock = threading.Lock()
+        self._flush_pending = False
     
     def emit(self, record):
         self.log_queue.put(record)
+        # Wake the UI only when there is something to show; a short timer
+        # gathers a burst of records into one batch
+        with self._flush_lock:
+            if self._flush_pending:
+                return
+            self._flush_pending = True
+        try:
+            self.text_widget.after(self.FLUSH_DELAY_MS, self.poll_log_queue)
+        except (tk.TclError, RuntimeError):
+            # Widget destroyed or Tk shut down; let a later record try again
+            with self._flush_lock:
+                self._flush_pending = False
     
     def poll_log_queue(self):
-        """Check for new log records and display them"""
+        """Display every queued log record with a single insert"""
+        with self._flush_lock:
+            self._flush_pending = False
+        lines = []
         try:
             while True:
-                record = self.log_queue.get_nowait()
-                self.text_widget.configure(state="normal")
-                self.text_widget.insert("end", self.format(record) + "\n")
-                self.text_widget.see("end")
-                self.text_widget.configure(state="disabled")
-                self.text_widget.update_idletasks()
+                lines.append(self.format(self.log_queue.get_nowait()))
                 self.log_queue.task_done()
         except queue.Empty:
             pass
-        self.text_widget.after(100, self.poll_log_queue)
+        if not lines:
+            return
+        self.text_widget.configure(state="normal")
+        self.text_widget.insert("end", "\n".join(lines) + "\n")
+        self.text_widget.see("end")
+        self.text_widget.configure(state="disabled")
+
+
+# Page chrome wrapped around every converted document
+_HTML_HEAD = """
+<div class="markdown-content" style="color:#333;font-family:Arial, sans-serif;line-height:1.6;margin:0 auto;max-width:800px;">
+    <div class="container" style="margin-left:auto;">
+        <div style="color:#333;font-family:Arial, sans-serif;line-height:1.6;">
+            <style>
+            p {margin-bottom: 2em;}
+            </style>
+            """
+_HTML_TAIL = """
+        </div>
+    </div>
+</div>
+"""
+
+
+# Extension sets of the Markdown converters. Each thread builds its own
+# instance of a set on first use, since a Markdown instance keeps
+# per-document state between reset() calls
+_MD_MAIN = ('extra', 'sane_lists', 'tables')
+_MD_NL2BR = ('extra', 'nl2br')
+_MD_SANE = ('extra', 'sane_lists')
+_md_local = threading.local()
+
+
+def _convert_with(extensions: tuple, text: str) -> str:
+    """
+    Convert markdown text with this thread's converter for an extension set
+    
+    Args:
+        extensions: An extension set such as ``_MD_MAIN``
+        text: The markdown text to convert
+        
+    Returns:
+        The converted HTML
+    """
+    converters = getattr(_md_local, 'converters', None)
+    if converters is None:
+        converters = _md_local.converters = {}
+    md = converters.get(extensions)
+    if md is None:
+        md = converters[extensions] = markdown.Markdown(extensions=list(extensions))
+    return md.reset().convert(text)
+
+
+def _style_h1(match) -> str:
+    """Wrap the text of an ``<h1>`` match in the brand-colored span."""
+    return f'{match.group(1)}\n    <span style="color:#920205;">{match.group(2)}</span>\n</h1>'
+
+
+def _render_special_section(section_type: str, section_content: str) -> str:
+    """Build the styled HTML that replaces an extracted special section."""
+    if section_type == "stop_reflect":
+        return create_stop_reflect_html(section_content)
+    if section_type == "key_takeaways":
+        return create_key_takeaways_html(section_content)
+    if section_type == "audio_instructions":
+        return create_audio_instructions_html(section_content)
+    return section_content
 
 
 def markdown_to_html(markdown_content: str) -> str:
@@ -62,105 +233,232 @@ def markdown_to_html(markdown_content: str) -> str:
     Returns:
         HTML content with properly formatted elements
     """
+    # Plain documents only need the conversion and the h1 styling
+    lower = markdown_content.lower()
+    if not any(marker in lower for marker in _SPECIAL_MARKERS):
+        html_content = _H1_RE.sub(_style_h1, _convert_with(_MD_MAIN, markdown_content))
+        return _HTML_HEAD + html_content + _HTML_TAIL
+    
     # Extract first heading for display
     first_heading = ""
-    heading_pattern = re.compile(r'^\s*#\s+(.*?)\s*$', re.MULTILINE)
-    heading_match = heading_pattern.search(markdown_content)
+    heading_match = _HEADING_RE.search(markdown_content)
     if heading_match:
         first_heading = heading_match.group(1).strip()
     
     # First handle the audio instructions directly before any other processing
     processed_md = pre_process_audio_instructions(markdown_content)
     
-    # Pre-process numbered lists to ensure proper HTML formatting
-    processed_md = pre_process_numbered_lists(processed_md)
-    
     # Extract special sections (stop and reflect, key takeaways) before conversion
     processed_content, special_sections = extract_special_sections(processed_md)
     
     # Convert markdown to HTML using the markdown library with appropriate extensions
-    html_content = markdown.markdown(
-        processed_content,
-        extensions=['extra', 'sane_lists', 'tables']
-    )
+    html_content = _convert_with(_MD_MAIN, processed_content)
     
     # Replace direct styling on headings with span elements for color styling
     # Handle h1 tags
-    h1_pattern = r'<h1>(.*?)</h1>'
-    h1_matches = re.finditer(h1_pattern, html_content)
-    for match in h1_matches:
-        original_h1 = match.group(0)
-        h1_content = match.group(1)
-        styled_h1 = f'<h1>\n    <span style="color:#920205;">{h1_content}</span>\n</h1>'
-        html_content = html_content.replace(original_h1, styled_h1)
-    
-    # Handle h2 Learning Objectives specifically
-    h2_learning_obj_pattern = r'(<h2>)(\s*Learning\s*Objectives\s*)(</h2>\s*)(<p>)(.*?)(</p>)(\s*<ul>)(.*?)(</ul>)'
-    h2_match = re.search(h2_learning_obj_pattern, html_content, re.DOTALL | re.IGNORECASE)
-    
-    if h2_match:
-        # Get all parts of the pattern
-        h2_open = h2_match.group(1)
-        h2_content = h2_match.group(2)
-        h2_close = h2_match.group(3)
-        p_open = h2_match.group(4)
-        p_content = h2_match.group(5)
-        p_close = h2_match.group(6)
-        ul_start = h2_match.group(7)
-        list_content = h2_match.group(8)
-        ul_end = h2_match.group(9)
-        
-        # Style with span elements instead of direct styling
-        styled_h2 = f'{h2_open}\n    <span style="color:#920205;">{h2_content}</span>\n{h2_close}'
-        styled_p = f'{p_open}\n    <span style="color:#920205;">{p_content}</span>\n{p_close}'
-        
-        # Style list items with spans
-        styled_list = re.sub(r'(<li>)(.*?)(</li>)', r'\1\n    <span style="color:#920205;">\2</span>\n\3', list_content)
-        
-        # Replace the entire section with the styled version
-        html_content = html_content.replace(h2_match.group(0), styled_h2 + styled_p + ul_start + styled_list + ul_end)
-    else:
-        # If that pattern didn't match, try a simpler approach for the h2
-        h2_pattern = r'<h2>(\s*Learning\s*Objectives\s*)</h2>'
-        h2_match = re.search(h2_pattern, html_content, re.IGNORECASE)
+    html_content = _H1_RE.sub(_style_h1, html_content)
+    
+    # Handle h2 Learning Objectives specifically. Both patterns need the word
+    # "Objectives", so documents without it skip the regexes entirely
+    if 'objectives' in html_content.casefold():
+        h2_match = _H2_LEARNING_RE.search(html_content)
+        
         if h2_match:
-            h2_content = h2_match.group(1)
-            styled_h2 = f'<h2>\n    <span style="color:#920205;">{h2_content}</span>\n</h2>'
-            html_content = html_content.replace(h2_match.group(0), styled_h2)
-    
-    # Replace special section placeholders with styled HTML
-    for placeholder, section_type, section_content in special_sections:
-        if section_type == "stop_reflect":
-            replacement = create_stop_reflect_html(section_content)
-        elif section_type == "key_takeaways":
-            replacement = create_key_takeaways_html(section_content)
-        elif section_type == "audio_instructions":
-            replacement = create_audio_instructions_html(section_content)
+            # Get all parts of the pattern
+            h2_open = h2_match.group(1)
+            h2_content = h2_match.group(2)
+            h2_close = h2_match.group(3)
+            p_open = h2_match.group(4)
+            p_content = h2_match.group(5)
+            p_close = h2_match.group(6)
+            ul_start = h2_match.group(7)
+            list_content = h2_match.group(8)
+            ul_end = h2_match.group(9)
+            
+            # Style with span elements instead of direct styling
+            styled_h2 = f'{h2_open}\n    <span style="color:#920205;">{h2_content}</span>\n{h2_close}'
+            styled_p = f'{p_open}\n    <span style="color:#920205;">{p_content}</span>\n{p_close}'
+            
+            # Style list items with spans
+            if '<li' in list_content:
+                styled_list = _LI_STYLE_RE.sub(_LI_STYLE, list_content)
+            else:
+                styled_list = list_content
+            
+            # Replace the entire section with the styled version
+            html_content = html_content.replace(h2_match.group(0), styled_h2 + styled_p + ul_start + styled_list + ul_end)
         else:
-            replacement = section_content
-        
-        html_content = html_content.replace(placeholder, replacement)
+            # If that pattern didn't match, try a simpler approach for the h2
+            h2_match = _H2_LEARNING_SIMPLE_RE.search(html_content)
+            if h2_match:
+                h2_open, h2_content = h2_match.group(1, 2)
+                styled_h2 = f'{h2_open}\n    <span style="color:#920205;">{h2_content}</span>\n</h2>'
+                html_content = html_content.replace(h2_match.group(0), styled_h2)
+    
+    # Replace special section placeholders with styled HTML in one pass
+    if special_sections:
+        replacements = {
+            placeholder: _render_special_section(section_type, section_content).strip()
+            for placeholder, section_type, section_content in special_sections
+        }
+        html_content = _PLACEHOLDER_RE.sub(
+            lambda match: replacements.get(match.group(0), match.group(0)),
+            html_content
+        )
     
     # Construct the final HTML structure
-    html_content = f"""
-<div class="markdown-content" style="color:#333;font-family:Arial, sans-serif;line-height:1.6;margin:0 auto;max-width:800px;">
-    <div class="container" style="margin-left:auto;">
-        <div style="color:#333;font-family:Arial, sans-serif;line-height:1.6;">
-            <style>
-            p {{margin-bottom: 2em;}}
-            </style>
-            {html_content}
-        </div>
-    </div>
-</div>
-"""
+    return _HTML_HEAD + html_content + _HTML_TAIL
+
+
+def _converter_fingerprint() -> bytes:
+    """Identify this converter build so cached HTML from older code is ignored."""
+    try:
+        with open(__file__, 'rb') as source_file:
+            source = source_file.read()
+    except OSError:
+        source = b""
+    return blake2b(source + markdown.__version__.encode(), digest_size=8).digest()
+
+
+# On-disk cache of converted documents, keyed by content hash. Each converter
+# build gets its own directory so entries from older builds can be pruned.
+_CACHE_ROOT = Path.home() / ".hope-clean-cache" / "md2html"
+_CACHE_SALT = _converter_fingerprint()
+_CACHE_DIR = _CACHE_ROOT / _CACHE_SALT.hex()
+# The oldest cached documents are deleted once the cache grows past this size
+_CACHE_MAX_BYTES = 64 << 20
+
+
+@lru_cache(maxsize=128)
+def _cached_convert(markdown_content: str) -> str:
+    """
+    Convert markdown with ``markdown_to_html``, reusing earlier results
     
-    # Apply some additional cleanup - remove extra line breaks 
-    html_content = re.sub(r'\n\s*\n', '\n', html_content)
+    Results are memoized in memory and persisted under ``_CACHE_DIR`` so that
+    re-running a batch over unchanged files skips the conversion pipeline.
+    Cache I/O failures fall back to a plain conversion. The directory is kept
+    bounded by ``_prune_html_cache``.
     
+    Args:
+        markdown_content: The markdown content to convert
+        
+    Returns:
+        HTML content, identical to ``markdown_to_html(markdown_content)``
+    """
+    digest = blake2b(markdown_content.encode("utf-8"), digest_size=16, key=_CACHE_SALT).hexdigest()
+    cache_path = _CACHE_DIR / f"{digest}.html"
+    try:
+        return cache_path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+    
+    html_content = markdown_to_html(markdown_content)
+    # Unique temp name so concurrent writers never share a partial file
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(html_content, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not cache converted HTML: {str(e)}")
+        # Don't leave the partial temp file behind
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
     return html_content
 
 
+# Files larger than this are decoded from a memory map
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _read_md(file_path: str) -> str:
+    """
+    Read a markdown file as text with universal newlines
+    
+    Large files are decoded straight from a read-only memory map, skipping
+    the text-mode read buffer.
+    
+    Args:
+        file_path: Path of the markdown file
+        
+    Returns:
+        The file content
+    """
+    if os.path.getsize(file_path) <= _MMAP_THRESHOLD:
+        return Path(file_path).read_text(encoding='utf-8')
+    
+    with open(file_path, 'rb') as md_file:
+        with mmap.mmap(md_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            text = str(mapped, 'utf-8')
+    # Match the newline translation of text mode
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _prune_html_cache() -> None:
+    """
+    Keep the on-disk HTML cache bounded
+    
+    Entries left by other converter builds can never be hit again and are
+    removed outright. In this build's directory the oldest entries are deleted
+    until the total size is back under ``_CACHE_MAX_BYTES``. Failures are
+    ignored, since another process may be pruning the cache at the same time.
+    """
+    try:
+        with os.scandir(_CACHE_ROOT) as entries:
+            stale = [(entry.path, entry.is_dir(follow_symlinks=False))
+                     for entry in entries if entry.name != _CACHE_DIR.name]
+    except OSError:
+        return
+    for path, is_dir in stale:
+        try:
+            if is_dir:
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+        except OSError:
+            pass
+    
+    cached = []
+    total = 0
+    try:
+        with os.scandir(_CACHE_DIR) as entries:
+            for entry in entries:
+                st = entry.stat(follow_symlinks=False)
+                cached.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+    except OSError:
+        return
+    if total <= _CACHE_MAX_BYTES:
+        return
+    
+    cached.sort()
+    for _mtime, size, path in cached:
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        if total <= _CACHE_MAX_BYTES:
+            break
+
+
+def _convert_one(file_path: str) -> str:
+    """
+    Read and convert a single markdown file; runs in a worker process
+    
+    Args:
+        file_path: Path of the markdown file
+        
+    Returns:
+        HTML content for the file
+    """
+    return _cached_convert(_read_md(file_path))
+
+
 def apply_learning_objectives_styling(html_content: str) -> str:
     """
     DEPRECATED: No longer needed as we're styling headings directly in markdown_to_html
@@ -181,53 +479,16 @@ def extract_special_sections(content: str) -> tuple:
     special_sections = []
     processed_content = content
     
-    # Extract Stop and Reflect sections - Markdown heading format
-    stop_reflect_pattern = r'(?:\n|^)\s*#{1,3}\s*Stop and Reflect\s*#{0,3}\s*(?:\n|$)(.*?)(?:(?:\n|^)\s*#{1,3}|$)'
-    for i, match in enumerate(re.finditer(stop_reflect_pattern, content, re.DOTALL | re.IGNORECASE)):
-        placeholder = f"<!-- SPECIAL_SECTION_STOP_REFLECT_{i} -->"
-        section_content = match.group(1).strip()
-        special_sections.append((placeholder, "stop_reflect", section_content))
-        processed_content = processed_content.replace(match.group(0), f"\n{placeholder}\n")
-    
-    # Extract Stop and Reflect sections - Triple dash format
-    triple_dash_stop_reflect_pattern = r'(?:\n|^)\s*---stopandreflect---\s*(?:\n|$)(.*?)(?:(?:\n|^)\s*---stopandreflectEND---|$)'
-    for i, match in enumerate(re.finditer(triple_dash_stop_reflect_pattern, content, re.DOTALL | re.IGNORECASE)):
-        placeholder = f"<!-- SPECIAL_SECTION_STOP_REFLECT_DASH_{i} -->"
-        section_content = match.group(1).strip()
-        special_sections.append((placeholder, "stop_reflect", section_content))
-        processed_content = processed_content.replace(match.group(0), f"\n{placeholder}\n")
-    
-    # Extract Key Takeaways sections - Markdown heading format
-    key_takeaways_pattern = r'(?:\n|^)\s*#{1,3}\s*Key Takeaways\s*#{0,3}\s*(?:\n|$)(.*?)(?:(?:\n|^)\s*#{1,3}|$)'
-    for i, match in enumerate(re.finditer(key_takeaways_pattern, content, re.DOTALL | re.IGNORECASE)):
-        placeholder = f"<!-- SPECIAL_SECTION_KEY_TAKEAWAYS_{i} -->"
-        section_content = match.group(1).strip()
-        special_sections.append((placeholder, "key_takeaways", section_content))
-        processed_content = processed_content.replace(match.group(0), f"\n{placeholder}\n")
-    
-    # Extract Key Takeaways sections - Triple dash format
-    triple_dash_key_takeaways_pattern = r'(?:\n|^)\s*---keytakeaways---\s*(?:\n|$)(.*?)(?:(?:\n|^)\s*---keytakeawaysEND---|$)'
-    for i, match in enumerate(re.finditer(triple_dash_key_takeaways_pattern, content, re.DOTALL | re.IGNORECASE)):
-        placeholder = f"<!-- SPECIAL_SECTION_KEY_TAKEAWAYS_DASH_{i} -->"
-        section_content = match.group(1).strip()
-        special_sections.append((placeholder, "key_takeaways", section_content))
-        processed_content = processed_content.replace(match.group(0), f"\n{placeholder}\n")
-    
-    # Extract Audio Instructions sections - Markdown heading format
-    audio_instructions_pattern = r'(?:\n|^)\s*#{1,3}\s*Audio Instructions\s*#{0,3}\s*(?:\n|$)(.*?)(?:(?:\n|^)\s*#{1,3}|$)'
-    for i, match in enumerate(re.finditer(audio_instructions_pattern, content, re.DOTALL | re.IGNORECASE)):
-        placeholder = f"<!-- SPECIAL_SECTION_AUDIO_INSTRUCTIONS_{i} -->"
-        section_content = match.group(1).strip()
-        special_sections.append((placeholder, "audio_instructions", section_content))
-        processed_content = processed_content.replace(match.group(0), f"\n{placeholder}\n")
-    
-    # Extract Audio Instructions sections - Triple dash format
-    triple_dash_audio_instructions_pattern = r'(?:\n|^)\s*---audioinstructions---\s*(?:\n|$)(.*?)(?:(?:\n|^)\s*---audioinstructionsEND---|$)'
-    for i, match in enumerate(re.finditer(triple_dash_audio_instructions_pattern, content, re.DOTALL | re.IGNORECASE)):
-        placeholder = f"<!-- SPECIAL_SECTION_AUDIO_INSTRUCTIONS_DASH_{i} -->"
-        section_content = match.group(1).strip()
-        special_sections.append((placeholder, "audio_instructions", section_content))
-        processed_content = processed_content.replace(match.group(0), f"\n{placeholder}\n")
+    # Each pattern scans the original content, in a fixed order, so when two
+    # sections run into each other the earlier pattern's match wins. Patterns
+    # whose '#' or '---' literal is missing can't match and are skipped.
+    for section_type, tag, literal, pattern in _SPECIAL_SECTIONS:
+        if literal not in content:
+            continue
+        for i, match in enumerate(pattern.finditer(content)):
+            placeholder = f"<!-- SPECIAL_SECTION_{tag}_{i} -->"
+            special_sections.append((placeholder, section_type, match.group(1).strip()))
+            processed_content = processed_content.replace(match.group(0), f"\n{placeholder}\n")
     
     return processed_content, special_sections
 
@@ -243,7 +504,7 @@ def create_stop_reflect_html(content: str) -> str:
         Formatted HTML
     """
     # Convert the content markdown to HTML
-    content_html = markdown.markdown(content, extensions=['extra', 'nl2br'])
+    content_html = _convert_with(_MD_NL2BR, content)
     
     # Create the styled layout with image and dashed border
     styled_html = f"""
@@ -277,10 +538,12 @@ def create_key_takeaways_html(content: str) -> str:
         return content
         
     # Remove any heading that contains "Key Takeaways" from the content
-    content = re.sub(r'#+\s*Key\s*Takeaways\s*.*?\n', '', content, flags=re.IGNORECASE)
+    # (only headings can match, so content without a '#' skips the regex)
+    if '#' in content:
+        content = _KEY_TAKEAWAYS_HEADING_RE.sub('', content)
     
     # Convert the cleaned content to HTML
-    content_html = markdown.markdown(content, extensions=['extra', 'sane_lists'])
+    content_html = _convert_with(_MD_SANE, content)
     
     # Create the styled table layout with image
     takeaways_html = f"""
@@ -309,6 +572,27 @@ def create_key_takeaways_html(content: str) -> str:
     return takeaways_html
 
 
+def _parse_audio_section(content: str) -> tuple:
+    """
+    Find the title and audio URL of an Audio Instructions section
+    
+    Args:
+        content: The stripped markdown content of the section
+        
+    Returns:
+        Tuple of (title, audio_url); the title falls back to a default
+    """
+    # The last heading line gives the title (without markdown heading symbols)
+    # and the last line with an audio link gives the URL
+    titles = _AUDIO_TITLE_RE.findall(content)
+    title = titles[-1].replace('Audio Instructions:', 'Lesson Podcast Discussion:') if titles else ""
+    urls = _AUDIO_LINE_URL_RE.findall(content)
+    audio_url = urls[-1] if urls else ""
+    
+    # If no title was found, use a default
+    return title or "Lesson Podcast Discussion", audio_url
+
+
 def create_audio_instructions_html(content: str) -> str:
     """
     Create HTML for Audio Instructions sections with an audio player
@@ -320,30 +604,13 @@ def create_audio_instructions_html(content: str) -> str:
         Formatted HTML with audio controls
     """
     # Parse the content to extract title and audio URL
-    lines = content.strip().split('\n')
-    title = ""
-    audio_url = ""
-    
-    # Extract title and URL from content
-    for line in lines:
-        if line.startswith('###') or line.startswith('#'):
-            # Extract title without the markdown heading symbols
-            title = re.sub(r'^#+\s*', '', line).replace('Audio Instructions:', 'Lesson Podcast Discussion:')
-        elif 'http' in line and ('.mp3' in line or '.wav' in line or '.ogg' in line):
-            # Extract the URL - clean up any line breaks or extra text
-            url_match = re.search(r'(https?://[^\s<>"]+\.(?:mp3|wav|ogg))', line)
-            if url_match:
-                audio_url = url_match.group(1)
-    
-    # If no title was found, use a default
-    if not title:
-        title = "Lesson Podcast Discussion"
+    title, audio_url = _parse_audio_section(content.strip())
     
     # Create the HTML with audio controls
     styled_html = f"""
 <h3>
-    <span style="color:#000000;">{title}</span> <audio controls="">
-        <source src="{audio_url}" type="audio/mpeg"> 
+    <span style="color:#000000;">{html.escape(title, quote=False)}</span> <audio controls="">
+        <source src="{html.escape(audio_url)}" type="audio/mpeg"> 
         Your browser does not support the audio element.
       </audio>
 </h3>
@@ -352,6 +619,12 @@ def create_audio_instructions_html(content: str) -> str:
     return styled_html
 
 
+# Batches convert in worker processes only when they have at least this many
+# files and this many bytes in total; each spawned worker re-imports the app
+_POOL_MIN_FILES = 8
+_POOL_MIN_BYTES = 4 << 20
+
+
 class MarkdownConverterPanel:
     """Handles markdown to HTML conversion for the ClaudeAIPanel."""
     
@@ -364,9 +637,11 @@ class MarkdownConverterPanel:
         """
         self.parent = parent
         self.is_converting = False
+        self._cancel_event = threading.Event()  # set to stop a running conversion
         self.files_to_convert = []
         self.output_dir = None
         self.conversion_thread = None
+        self._executor = None  # process pool for large batches, kept across runs
         
     def setup_converter_tab(self):
         """Set up the markdown to HTML converter tab."""
@@ -551,6 +826,7 @@ class MarkdownConverterPanel:
         
         # Update UI
         self.is_converting = True
+        self._cancel_event.clear()
         self.convert_btn.config(state=tk.DISABLED)
         self.cancel_btn.config(state=tk.NORMAL)
         self.progress_bar.config(value=0)
@@ -575,70 +851,93 @@ class MarkdownConverterPanel:
             # Initialize variables
             converted_files = []
             total_files = len(files)
-            combined_html = "" if combine_output else None
-            combined_filename = None
             current_file_count = 0
             
-            # Process each file
+            # (basename, stem) of each file, computed once
+            names = []
             for file_path in files:
-                # Check if conversion was cancelled
-                if not self.is_converting:
-                    self.parent.after(0, lambda: self.update_status("Conversion cancelled."))
-                    break
-                
-                # Get the basename and update status
                 basename = os.path.basename(file_path)
-                self.update_status(f"Converting {basename}...")
-                logger.info(f"Converting {basename}")
-                
-                try:
-                    # Read the markdown file
-                    with open(file_path, 'r', encoding='utf-8') as md_file:
-                        markdown_content = md_file.read()
-                    
-                    # Convert to HTML
-                    html_content = markdown_to_html(markdown_content)
-                    
-                    # If combining output, append to combined HTML
-                    if combine_output:
-                        if not combined_filename:
+                names.append((basename, os.path.splitext(basename)[0]))
+            
+            # Documents finished out of order, held until every earlier file is
+            # done so the combined file keeps the original order (None = failed)
+            combined_parts = {}
+            next_index = 0
+            combined_file = None
+            combined_output_path = None
+            
+            def flush_combined():
+                """Stream every in-order finished document into the combined file"""
+                nonlocal next_index, combined_file, combined_output_path
+                while next_index in combined_parts:
+                    html_content = combined_parts.pop(next_index)
+                    if html_content is not None:
+                        file_title = names[next_index][1]
+                        if combined_file is None:
                             # Use the first file's name as the base for the combined file
-                            combined_filename = os.path.splitext(basename)[0] + "_combined.html"
-                        
+                            combined_output_path = os.path.join(output_dir, file_title + "_combined.html")
+                            combined_file = open(combined_output_path, 'w', encoding='utf-8', buffering=1 << 20)
                         # Add a section heading for this file
-                        file_title = os.path.splitext(basename)[0]
-                        combined_html += f"<h1 style='margin-top:30px;border-top:1px solid #ccc;padding-top:20px;'>{file_title}</h1>\n{html_content}\n\n"
-                    else:
-                        # Create output HTML file
-                        output_filename = os.path.splitext(basename)[0] + ".html"
-                        output_path = os.path.join(output_dir, output_filename)
+                        combined_file.write(f"<h1 style='margin-top:30px;border-top:1px solid #ccc;padding-top:20px;'>{file_title}</h1>\n{html_content}\n\n")
+                    next_index += 1
+            
+            # Convert the files in parallel, handling results as they finish
+            self.update_status(f"Converting {total_files} files...")
+            try:
+                for index, file_path, html_content, error in self._iter_conversions(files):
+                    basename, stem = names[index]
+                    if error is not None:
+                        logger.error(f"Error converting {basename}: {str(error)}")
+                        logger.error("".join(traceback.format_exception(type(error), error, error.__traceback__)))
+                        if combine_output:
+                            combined_parts[index] = None
+                            flush_combined()
+                        continue
+                    
+                    logger.info(f"Converted {basename}")
+                    try:
+                        # If combining output, write the HTML once every earlier file is done
+                        if combine_output:
+                            combined_parts[index] = html_content
+                            flush_combined()
+                        else:
+                            # Create output HTML file
+                            output_filename = stem + ".html"
+                            output_path = os.path.join(output_dir, output_filename)
+                            
+                            with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as html_file:
+                                html_file.write(html_content)
                         
-                        with open(output_path, 'w', encoding='utf-8') as html_file:
-                            html_file.write(html_content)
+                            converted_files.append(output_path)
+                            logger.info(f"Created {output_filename}")
                         
-                        converted_files.append(output_path)
-                        logger.info(f"Created {output_filename}")
-                    
-                    # Update progress
-                    current_file_count += 1
-                    progress = int((current_file_count / total_files) * 100)
-                    self.update_progress(progress)
-                    
-                except Exception as e:
-                    logger.error(f"Error converting {basename}: {str(e)}")
-                    logger.error(traceback.format_exc())
+                        # Update progress
+                        current_file_count += 1
+                        progress = int((current_file_count / total_files) * 100)
+                        self.update_progress(progress)
+                        
+                    except Exception as e:
+                        logger.error(f"Error converting {basename}: {str(e)}")
+                        logger.error(traceback.format_exc())
+            finally:
+                if combined_file is not None:
+                    combined_file.close()
+            
+            # Drop cached HTML from older builds and keep the cache under its cap
+            _prune_html_cache()
             
-            # If combining output, write the combined file
-            if combine_output and combined_filename and self.is_converting:
-                combined_output_path = os.path.join(output_dir, combined_filename)
-                with open(combined_output_path, 'w', encoding='utf-8') as combined_file:
-                    combined_file.write(combined_html)
-                
+            cancelled = self._cancel_event.is_set()
+            if cancelled:
+                self.update_status("Conversion cancelled.")
+                # Don't leave a partial combined file behind
+                if combined_output_path is not None:
+                    os.remove(combined_output_path)
+            elif combined_output_path is not None:
                 converted_files = [combined_output_path]
-                logger.info(f"Created combined file: {combined_filename}")
+                logger.info(f"Created combined file: {os.path.basename(combined_output_path)}")
             
             # Final status update
-            if self.is_converting:
+            if not cancelled:
                 if current_file_count == total_files:
                     self.update_status(f"Conversion complete. {current_file_count} files converted.")
                     logger.info(f"Conversion complete. {current_file_count} files converted.")
@@ -649,12 +948,7 @@ class MarkdownConverterPanel:
                             # Open the file with the default application
                             self.update_status(f"Opening {os.path.basename(output_file)}...")
                             try:
-                                if sys.platform == 'win32':
-                                    os.startfile(output_file)
-                                elif sys.platform == 'darwin':  # macOS
-                                    subprocess.run(['open', output_file])
-                                else:  # Linux
-                                    subprocess.run(['xdg-open', output_file])
+                                _open_with_default_app(output_file)
                             except Exception as e:
                                 logger.error(f"Error opening file: {str(e)}")
             
@@ -667,6 +961,83 @@ class MarkdownConverterPanel:
             self.update_status(f"Error: {str(e)}")
             self.parent.after(0, self.reset_ui)
     
+    def _iter_conversions(self, files):
+        """
+        Convert files, yielding ``(index, file_path, html, error)`` as each finishes
+        
+        Batches below ``_POOL_MIN_FILES`` files or ``_POOL_MIN_BYTES`` bytes are
+        converted in-process, where starting worker processes would cost more
+        than it saves and the conversion caches carry over between files.
+        Larger batches are spread over the panel's process pool. Stops early,
+        cancelling queued work, once the conversion is cancelled.
+        """
+        if not self._use_process_pool(files):
+            for index, file_path in enumerate(files):
+                if self._cancel_event.is_set():
+                    return
+                try:
+                    yield index, file_path, _convert_one(file_path), None
+                except Exception as e:
+                    yield index, file_path, None, e
+            return
+        
+        executor = self._get_executor()
+        futures = {executor.submit(_convert_one, path): index for index, path in enumerate(files)}
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                if self._cancel_event.is_set():
+                    break
+                index = futures[future]
+                try:
+                    yield index, files[index], future.result(), None
+                except Exception as e:
+                    if isinstance(e, concurrent.futures.BrokenExecutor):
+                        # A dead worker breaks the pool; start a fresh one next run
+                        self.cleanup()
+                    yield index, files[index], None, e
+        finally:
+            # Drop whatever is still queued; the pool itself is kept for later runs
+            for future in futures:
+                future.cancel()
+    
+    @staticmethod
+    def _use_process_pool(files) -> bool:
+        """
+        Decide whether a batch is large enough to convert in worker processes
+        
+        Args:
+            files: Paths of the markdown files in the batch
+            
+        Returns:
+            True if the batch meets both the file-count and total-size thresholds
+        """
+        if len(files) < _POOL_MIN_FILES:
+            return False
+        total = 0
+        for file_path in files:
+            try:
+                total += os.path.getsize(file_path)
+            except OSError:
+                # Unreadable files are reported when they are converted
+                continue
+            if total >= _POOL_MIN_BYTES:
+                return True
+        return False
+    
+    def _get_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Return the panel's process pool, starting it on first use"""
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+    
+    def cleanup(self):
+        """Shut down the conversion process pool, if one was started"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
     def update_status(self, message):
         """Update status label from any thread"""
         self.parent.after(0, lambda: self.status_var.set(message))
@@ -684,94 +1055,31 @@ class MarkdownConverterPanel:
     def cancel_conversion(self):
         """Cancel the ongoing batch conversion"""
         if self.is_converting:
-            self.is_converting = False
+            self._cancel_event.set()
             self.update_status("Cancelling conversion...")
             logger.info("User cancelled conversion")
 
 
-def pre_process_audio_instructions(markdown_content: str) -> str:
-    """
-    Pre-process audio instructions to directly replace them with HTML audio players
-    
-    Args:
-        markdown_content: The markdown content to process
-        
-    Returns:
-        Processed markdown content with audio sections replaced
-    """
-    processed_content = markdown_content
-    
-    # Extract Audio Instructions sections - Triple dash format
-    triple_dash_audio_pattern = r'(?:\n|^)\s*---audioinstructions---\s*(?:\n|$)(.*?)(?:(?:\n|^)\s*---audioinstructionsEND---|$)'
-    for i, match in enumerate(re.finditer(triple_dash_audio_pattern, processed_content, re.DOTALL | re.IGNORECASE)):
-        section_content = match.group(1).strip()
-        
-        # Extract title and URL from content
-        lines = section_content.strip().split('\n')
-        title = ""
-        audio_url = ""
-        
-        for line in lines:
-            if line.startswith('###') or line.startswith('#'):
-                # Extract title without markdown heading symbols
-                title = re.sub(r'^#+\s*', '', line).replace('Audio Instructions:', 'Lesson Podcast Discussion:')
-            elif 'http' in line and ('.mp3' in line or '.wav' in line or '.ogg' in line):
-                # Extract the URL - clean up any line breaks or extra text
-                url_match = re.search(r'(https?://[^\s<>"]+\.(?:mp3|wav|ogg))', line)
-                if url_match:
-                    audio_url = url_match.group(1)
-        
-        # If no title was found, use a default
-        if not title:
-            title = "Lesson Podcast Discussion"
-        
-        # Create the HTML with audio controls
-        audio_html = f"""
+# HTML layouts the triple-dash sections are replaced with
+_AUDIO_TEMPLATE = """
 <h3>
     <span style="color:#000000;">{title}</span> <audio controls="">
-        <source src="{audio_url}" type="audio/mpeg"> 
+        <source src="{url}" type="audio/mpeg"> 
         Your browser does not support the audio element.
       </audio>
 </h3>
         """
-        
-        # Replace the entire audio section with the HTML
-        processed_content = processed_content.replace(match.group(0), audio_html)
-    
-    # Extract Stop and Reflect sections - Triple dash format
-    triple_dash_reflect_pattern = r'(?:\n|^)\s*---stopandreflect---\s*(?:\n|$)(.*?)(?:(?:\n|^)\s*---stopandreflectEND---|$)'
-    for i, match in enumerate(re.finditer(triple_dash_reflect_pattern, processed_content, re.DOTALL | re.IGNORECASE)):
-        section_content = match.group(1).strip()
-        content_html = markdown.markdown(section_content, extensions=['extra', 'nl2br'])
-        
-        # Create the styled layout with image and dashed border
-        reflect_html = f"""
+_REFLECT_TEMPLATE = """
 <div class="stop-reflect-container" style="border:3px dashed #e50200;display:flex;margin:20px 0;padding:0;width:100%;">
         <div class="stop-reflect-image" style="align-items:center;display:flex;justify-content:center;min-width:100px;padding:10px;width:20%;">
             <img class="image_resized" style="height:auto;max-width:150px;width:100%;" src="https://api.learnstage.com/media-manager/api/access/exceled/default/lms/courses/1648/Images/stopandreflect.jpg" alt="Stop and Reflect">
         </div>
         <div class="stop-reflect-content" style="display:flex;flex-direction:column;justify-content:center;padding:15px;width:80%;">
-            {content_html}
+            {content}
         </div>
     </div>
         """
-        
-        # Replace the entire section with the HTML
-        processed_content = processed_content.replace(match.group(0), reflect_html)
-    
-    # Extract Key Takeaways sections - Triple dash format
-    triple_dash_takeaways_pattern = r'(?:\n|^)\s*---keytakeaways---\s*(?:\n|$)(.*?)(?:(?:\n|^)\s*---keytakeawaysEND---|$)'
-    for i, match in enumerate(re.finditer(triple_dash_takeaways_pattern, processed_content, re.DOTALL | re.IGNORECASE)):
-        section_content = match.group(1).strip()
-        
-        # Remove any heading that contains "Key Takeaways" from the content
-        section_content = re.sub(r'#+\s*Key\s*Takeaways\s*.*?\n', '', section_content, flags=re.IGNORECASE)
-        
-        # Convert the cleaned content to HTML
-        content_html = markdown.markdown(section_content, extensions=['extra', 'nl2br'])
-        
-        # Create the styled table layout with image
-        takeaways_html = f"""
+_TAKEAWAYS_TEMPLATE = """
 <figure class="table" style="float:left;width:92.41%;">
         <table class="ck-table-resized" style="border-style:none;">
             <colgroup><col style="width:13.29%;"><col style="width:86.71%;"></colgroup>
@@ -786,32 +1094,97 @@ def pre_process_audio_instructions(markdown_content: str) -> str:
                         <h3>
                             <span style="color:hsl(359,97%,29%);"><strong>Key Takeaways</strong></span>
                         </h3>
-                        {content_html}
+                        {content}
                     </td>
                 </tr>
             </tbody>
         </table>
     </figure>
         """
-        
-        # Replace the entire section with the HTML
-        processed_content = processed_content.replace(match.group(0), takeaways_html)
+
+
+# Static markup around each placeholder, so building a section is one join
+# rather than a str.format scan over the whole template
+_AUDIO_PREFIX, _AUDIO_MID, _AUDIO_SUFFIX = re.split(r'\{title\}|\{url\}', _AUDIO_TEMPLATE)
+_REFLECT_PREFIX, _REFLECT_SUFFIX = _REFLECT_TEMPLATE.split('{content}')
+_TAKEAWAYS_PREFIX, _TAKEAWAYS_SUFFIX = _TAKEAWAYS_TEMPLATE.split('{content}')
+
+
+@lru_cache(maxsize=256)
+def _md_to_html(section_content: str) -> str:
+    """Render a section body; templated lessons repeat the same bodies often."""
+    return _convert_with(_MD_NL2BR, section_content)
+
+
+def _build_audio_html(section_content: str) -> str:
+    """Build the audio player HTML for a triple-dash Audio Instructions section."""
+    title, audio_url = _parse_audio_section(section_content)
     
-    return processed_content
+    # Create the HTML with audio controls
+    return "".join((_AUDIO_PREFIX, html.escape(title, quote=False), _AUDIO_MID, html.escape(audio_url), _AUDIO_SUFFIX))
 
 
-def pre_process_numbered_lists(markdown_content: str) -> str:
+def _build_reflect_html(section_content: str) -> str:
+    """Build the dashed-border layout for a triple-dash Stop and Reflect section."""
+    content_html = _md_to_html(section_content)
+    
+    # Create the styled layout with image and dashed border
+    return "".join((_REFLECT_PREFIX, content_html, _REFLECT_SUFFIX))
+
+
+def _build_takeaways_html(section_content: str) -> str:
+    """Build the table layout for a triple-dash Key Takeaways section."""
+    # Drop a leading "Key Takeaways" heading; the layout has its own
+    first_line, _, rest = section_content.partition('\n')
+    heading = first_line.lstrip('#')
+    if heading != first_line and ''.join(heading.split()).lower().startswith('keytakeaways'):
+        section_content = rest
+    
+    # Convert the cleaned content to HTML
+    content_html = _md_to_html(section_content)
+    
+    # Create the styled table layout with image
+    return "".join((_TAKEAWAYS_PREFIX, content_html, _TAKEAWAYS_SUFFIX))
+
+
+_TRIPLE_DASH_BUILDERS = {
+    "audio": _build_audio_html,
+    "reflect": _build_reflect_html,
+    "takeaways": _build_takeaways_html,
+}
+
+
+def pre_process_audio_instructions(markdown_content: str) -> str:
     """
-    Process numbered lists to ensure proper HTML formatting.
-    This function no longer escapes numbered lists, allowing them to be properly
-    converted to HTML ordered lists (<ol> elements).
+    Pre-process audio instructions to directly replace them with HTML audio players
+    
+    Stop and Reflect and Key Takeaways sections in triple-dash format are
+    replaced with their HTML layouts in the same pass.
     
     Args:
         markdown_content: The markdown content to process
         
     Returns:
-        Processed markdown content with proper list formatting
+        Processed markdown content with audio sections replaced
     """
-    # Simply return the content unchanged to allow the markdown processor
-    # to handle numbered lists properly
-    return markdown_content
+    # Every section opens with a '---' marker; skip the regex when none is present
+    if '---' not in markdown_content:
+        return markdown_content
+    lower = markdown_content.lower()
+    if not any(marker in lower for marker in _TRIPLE_DASH_MARKERS):
+        return markdown_content
+    
+    return _replace_triple_dash_sections(markdown_content)
+
+
+def _replace_triple_dash(match) -> str:
+    """Build the HTML for one triple-dash section match."""
+    # The outer group of the alternative that matched names the section
+    name = match.lastgroup
+    return _TRIPLE_DASH_BUILDERS[name](match.group(f"{name}_body").strip())
+
+
+@lru_cache(maxsize=128)
+def _replace_triple_dash_sections(markdown_content: str) -> str:
+    """Replace every triple-dash section; memoized since the result only depends on the text."""
+    return _TRIPLE_DASH_RE.sub(_replace_triple_dash, markdown_content)
@@ -1,6 +1,14 @@
 """Simple Markdown Editor Module for ClaudeAIPanel"""
 
 import os
+import re
+import mmap
+import threading
+from bisect import bisect_right
+from collections import defaultdict
+from functools import lru_cache
+from itertools import accumulate
+from typing import Optional
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog, Menu
 from .path_utils import get_project_root
@@ -11,11 +19,65 @@ try:
     CLIPBOARD_AVAILABLE = True
 except ImportError:
     CLIPBOARD_AVAILABLE = False
+
+# Backups are skipped if the core file utilities can't be imported
+try:
+    from showup_core.file_utils import create_timestamped_backup
+except ImportError:
+    create_timestamped_backup = None
 import logging
 
 # Get logger
 logger = logging.getLogger("output_library_editor")
 
+# Markdown constructs highlighted in the editor. Heading and list lines are
+# told apart by the named group that matched.
+_BLOCK_RE = re.compile(r'^[^\S\n]*(?:(?P<heading>#)|(?P<list>[-*] |\d+\. ))[^\n]*', re.MULTILINE)
+_CODE_RE = re.compile(r'`[^`\n]*`')
+_EMPHASIS_RE = re.compile(r'(?<!\*)\*[^*\n]+\*|(?<!_)_[^_\n]+_')
+_HIGHLIGHT_TAGS = ("heading", "emphasis", "code", "list")
+
+# Parsed snippets by file path, with the modification time they were read at
+_SNIPPETS_CACHE: dict[str, tuple[int, list[str]]] = {}
+
+# Files larger than this are opened by decoding a memory map
+_MMAP_THRESHOLD = 2_000_000
+
+
+def _read_text(file_path: str) -> str:
+    """
+    Read a file as UTF-8 text with universal newlines.
+    
+    Args:
+        file_path: Path of the file to read
+        
+    Returns:
+        str: The file content
+    """
+    if os.path.getsize(file_path) <= _MMAP_THRESHOLD:
+        with open(file_path, "r", encoding="utf-8", buffering=1 << 18) as f:
+            return f.read()
+    
+    with open(file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            content = str(mapped, "utf-8")
+    # Match the newline translation of text mode
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+@lru_cache(maxsize=None)
+def _snippets_path() -> str:
+    """Return the path of the snippets file in the data/input directory."""
+    return os.path.join(
+        str(get_project_root()),
+        "showup-editor-ui",
+        "data",
+        "input",
+        "snippets.txt",
+    )
+
 
 class ToolTip:
     """Simple tooltip implementation for tkinter widgets."""
@@ -58,6 +120,12 @@ class ToolTip:
 class MarkdownEditor:
     """Provides a simple markdown editor without API calls."""
     
+    # Typing pause after which the buffer is re-highlighted
+    HIGHLIGHT_DELAY_MS = 150
+    # Files at or above either size are opened without highlighting
+    HIGHLIGHT_MAX_CHARS = 1_000_000
+    HIGHLIGHT_MAX_LINES = 5000
+    
     def __init__(self, parent):
         """
         Initialize the markdown editor.
@@ -67,7 +135,20 @@ class MarkdownEditor:
         """
         self.parent = parent
         self.current_file_path = None
+        self._basename = None
+        # Mirrors the editor's "disabled" state so highlighting needn't query Tk
+        self._editor_disabled = False
         self.snippets = self._load_snippets()
+        self._highlight_after_id = None
+        self._highlight_enabled = True
+        self._saving = False
+        # (path, content) of a save requested while another save was running
+        self._save_pending = None
+        # Visible range and text hash of the last highlight pass
+        self._last_highlight_key = None
+        # Context menu built once per snippet load, see _build_context_menu
+        self._context_menu = None
+        self._ai_menu_entry_shown = False
         
         # Get access to AI detector if available
         self.ai_detector = getattr(self.parent, 'ai_detector', None)
@@ -133,10 +214,16 @@ class MarkdownEditor:
         self.editor.tag_configure("code", foreground="dark red", background="#f0f0f0")
         self.editor.tag_configure("list", foreground="purple")
         
+        # Highlighting covers only the visible lines, so redo it whenever the
+        # view scrolls or resizes
+        self.editor.configure(yscrollcommand=self._on_editor_scroll)
+        self.editor.bind("<Configure>", lambda e: self._schedule_highlight())
+        
         # Bind key events for syntax highlighting and save shortcut
         self.editor.bind("<KeyRelease>", self._on_key_release)
         self.editor.bind("<Control-s>", lambda e: self.save_file())
         self.editor.bind("<Button-3>", self._show_context_menu)
+        self._build_context_menu()
         
         # Log setup completion
         logger.info("Markdown editor tab setup complete")
@@ -152,18 +239,29 @@ class MarkdownEditor:
         if file_path:
             try:
                 # Read file content
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
+                content = _read_text(file_path)
                 
                 # Clear and update editor
                 self.editor.config(state="normal")  # Ensure the widget is editable before modifications
-                self.editor.delete(1.0, tk.END)
-                self.editor.insert(tk.END, content)
-                self.editor.config(state="normal")  # Keep it in normal state for editing
+                self._editor_disabled = False
+                # Swap the buffer in one edit, kept apart from earlier undo steps
+                self.editor.edit_separator()
+                self.editor.replace("1.0", tk.END, content)
+                self.editor.edit_separator()
+                self._last_highlight_key = None  # the replace dropped all tags
+                
+                # Large files stay responsive without highlighting
+                self._highlight_enabled = (
+                    len(content) < self.HIGHLIGHT_MAX_CHARS
+                    and content.count("\n") < self.HIGHLIGHT_MAX_LINES
+                )
                 
                 # Update file path and UI
-                self.current_file_path = file_path
-                self.status_label.config(text=f"Editing: {os.path.basename(file_path)}")
+                self._set_current_path(file_path)
+                status = f"Editing: {self._basename}"
+                if not self._highlight_enabled:
+                    status += " (highlighting disabled, large file)"
+                self.status_label.config(text=status)
                 self.save_btn.config(state="normal")
                 
                 # Apply syntax highlighting
@@ -177,36 +275,94 @@ class MarkdownEditor:
                 logger.error(f"Error opening file: {error_msg}")
                 messagebox.showerror("Error", f"Could not open file: {error_msg}")
     
+    def _set_current_path(self, file_path: Optional[str]) -> None:
+        """
+        Set the file being edited and cache its name for status messages.
+        
+        Args:
+            file_path: The file path, or None when no file is loaded
+        """
+        self.current_file_path = file_path
+        self._basename = os.path.basename(file_path) if file_path else None
+    
     def save_file(self):
         """Save the current file."""
         if not self.current_file_path:
             self.save_file_as()
             return
         
+        # Get content from editor
+        content = self.editor.get(1.0, tk.END)
+        
+        # Snapshot the buffer and write it once the running save finishes, so
+        # nothing typed since is lost even if another file is opened meanwhile
+        if self._saving:
+            self._save_pending = (self.current_file_path, content)
+            return
+        
+        self._start_save(self.current_file_path, content)
+    
+    def _start_save(self, file_path: str, content: str) -> None:
+        """
+        Back up and write a file on a worker thread so the editor stays responsive.
+        
+        Args:
+            file_path: The file to write
+            content: The editor content to save
+        """
+        self._saving = True
+        self.save_btn.config(state="disabled")
+        self.status_label.config(text=f"Saving: {os.path.basename(file_path)}...")
+        threading.Thread(target=self._do_save, args=(file_path, content)).start()
+    
+    def _do_save(self, file_path: str, content: str) -> None:
+        """
+        Back up and write a file off the Tk thread, then report back on it.
+        
+        Args:
+            file_path: The file to write
+            content: The editor content to save
+        """
+        error_msg = None
         try:
-            # Get content from editor
-            content = self.editor.get(1.0, tk.END)
-            
             # Create backup of original file
-            if os.path.exists(self.current_file_path):
-                from showup_core.file_utils import create_timestamped_backup
-
-                create_timestamped_backup(self.current_file_path)
+            if create_timestamped_backup and os.path.exists(file_path):
+                create_timestamped_backup(file_path)
             
             # Save content to file
-            with open(self.current_file_path, "w", encoding="utf-8") as f:
+            with open(file_path, "w", encoding="utf-8", buffering=1 << 18) as f:
                 f.write(content)
             
-            # Update status
-            self.status_label.config(text=f"Saved: {os.path.basename(self.current_file_path)}")
-            
             # Log save operation
-            logger.info(f"Saved file: {self.current_file_path}")
+            logger.info(f"Saved file: {file_path}")
             
         except Exception as e:
             error_msg = str(e)
             logger.error(f"Error saving file: {error_msg}")
+        
+        self.parent.after(0, self._on_save_done, file_path, error_msg)
+    
+    def _on_save_done(self, file_path: str, error_msg) -> None:
+        """
+        Update the UI after a save finishes.
+        
+        Args:
+            file_path: The file that was written
+            error_msg: The error message, or None if the save succeeded
+        """
+        self._saving = False
+        self.save_btn.config(state="normal")
+        
+        if error_msg is None:
+            # Update status
+            self.status_label.config(text=f"Saved: {os.path.basename(file_path)}")
+        else:
             messagebox.showerror("Error", f"Could not save file: {error_msg}")
+        
+        # Write the queued snapshot, whichever file is open now
+        pending, self._save_pending = self._save_pending, None
+        if pending is not None:
+            self._start_save(*pending)
     
     def save_file_as(self):
         """Save the current file with a new name."""
@@ -218,17 +374,15 @@ class MarkdownEditor:
         
         if file_path:
             # Update current file path
-            self.current_file_path = file_path
+            self._set_current_path(file_path)
             
-            # Save file with new path
+            # Save file with new path; the save button is enabled once it's written
             self.save_file()
-            
-            # Enable save button
-            self.save_btn.config(state="normal")
     
     def reload_snippets(self):
         """Reload text snippets from the snippets file."""
         self.snippets = self._load_snippets()
+        self._build_context_menu()
         messagebox.showinfo("Snippets Reloaded", f"Loaded {len(self.snippets)} snippets")
         logger.info(f"Reloaded {len(self.snippets)} snippets")
     
@@ -258,7 +412,7 @@ class MarkdownEditor:
             
             # Reset status after 3 seconds
             self.parent.after(3000, lambda: self.status_label.config(
-                text="No file loaded" if not self.current_file_path else f"Editing: {os.path.basename(self.current_file_path)}"))
+                text="No file loaded" if not self.current_file_path else f"Editing: {self._basename}"))
             
             logger.info("Content copied to clipboard")
         except Exception as e:
@@ -267,86 +421,92 @@ class MarkdownEditor:
     
     def _on_key_release(self, event):
         """Handle key release events for real-time syntax highlighting."""
-        # Apply syntax highlighting
+        self._schedule_highlight()
+    
+    def _on_editor_scroll(self, first, last):
+        """Update the scrollbar and highlight the newly visible lines."""
+        self.editor.vbar.set(first, last)
+        self._schedule_highlight()
+    
+    def _schedule_highlight(self):
+        """Re-highlight once input or scrolling pauses rather than on every event."""
+        if self._highlight_after_id is not None:
+            self.editor.after_cancel(self._highlight_after_id)
+        self._highlight_after_id = self.editor.after(self.HIGHLIGHT_DELAY_MS, self._do_highlight)
+    
+    def _do_highlight(self):
+        """Run the highlight pass scheduled by _schedule_highlight."""
+        self._highlight_after_id = None
         self._highlight_syntax()
     
     def _highlight_syntax(self):
         """Apply basic syntax highlighting to the markdown text."""
+        if not self._highlight_enabled:
+            return
+        
         try:
+            # Get the visible lines; every highlighted construct is within a line
+            first, last = self._visible_range()
+            text = self.editor.get(first, last)
+            
+            # Keys that don't change the text (arrows, modifiers) need no new pass
+            highlight_key = (first, last, hash(text))
+            if highlight_key == self._last_highlight_key:
+                return
+            self._last_highlight_key = highlight_key
+            
             # Make sure the editor is in a normal state before making changes
-            current_state = str(self.editor.cget("state"))
-            if current_state == "disabled":
+            if self._editor_disabled:
                 self.editor.config(state="normal")
             
-            # Remove existing tags
-            for tag in ["heading", "emphasis", "code", "list"]:
-                self.editor.tag_remove(tag, "1.0", tk.END)
-            
-            # Get all text
-            text = self.editor.get("1.0", tk.END)
-            
-            # Find and tag headings (# heading)
-            line_num = 1
-            for line in text.split("\n"):
-                # Heading
-                if line.strip().startswith("#"):
-                    start_index = f"{line_num}.0"
-                    end_index = f"{line_num}.{len(line)}"
-                    self.editor.tag_add("heading", start_index, end_index)
-                
-                # List items
-                if line.strip().startswith("- ") or line.strip().startswith("* ") or line.strip().startswith("1. "):
-                    start_index = f"{line_num}.0"
-                    end_index = f"{line_num}.{len(line)}"
-                    self.editor.tag_add("list", start_index, end_index)
-                
-                line_num += 1
-            
-            # Find and tag inline code (`code`)
-            start_index = "1.0"
-            while True:
-                # Find opening backtick
-                code_start = self.editor.search("`", start_index, stopindex=tk.END)
-                if not code_start:
-                    break
-                
-                # Find closing backtick
-                code_end = self.editor.search("`", f"{code_start}+1c", stopindex=tk.END)
-                if not code_end:
-                    break
-                
-                # Add tag
-                self.editor.tag_add("code", code_start, f"{code_end}+1c")
-                
-                # Move start index past this code block
-                start_index = f"{code_end}+1c"
-            
-            # Find and tag emphasis (*text* or _text_)
-            for delimiter in ["*", "_"]:
-                start_index = "1.0"
-                while True:
-                    # Find opening delimiter
-                    emph_start = self.editor.search(delimiter, start_index, stopindex=tk.END)
-                    if not emph_start:
-                        break
-                    
-                    # Find closing delimiter
-                    emph_end = self.editor.search(delimiter, f"{emph_start}+1c", stopindex=tk.END)
-                    if not emph_end:
-                        break
-                    
-                    # Add tag
-                    self.editor.tag_add("emphasis", emph_start, f"{emph_end}+1c")
-                    
-                    # Move start index past this emphasis
-                    start_index = f"{emph_end}+1c"
+            first_line = int(first.split(".")[0])
+            
+            # Offset of the first character of each line, to turn match
+            # offsets into Tk "line.column" indices
+            line_starts = [0]
+            line_starts.extend(accumulate(len(line) + 1 for line in text.split("\n")))
+            
+            def to_index(offset):
+                line = bisect_right(line_starts, offset)
+                return f"{first_line + line - 1}.{offset - line_starts[line - 1]}"
+            
+            # Collect the ranges for each tag in one pass per pattern
+            ranges = {tag: [] for tag in _HIGHLIGHT_TAGS}
+            for match in _BLOCK_RE.finditer(text):
+                ranges[match.lastgroup].extend((to_index(match.start()), to_index(match.end())))
+            for match in _CODE_RE.finditer(text):
+                ranges["code"].extend((to_index(match.start()), to_index(match.end())))
+            for match in _EMPHASIS_RE.finditer(text):
+                ranges["emphasis"].extend((to_index(match.start()), to_index(match.end())))
+            
+            # Clear the old tags in a single Tcl call, then add all ranges of
+            # a tag in one call
+            self.editor.tk.call(
+                "foreach", "tag", _HIGHLIGHT_TAGS,
+                f"{self.editor} tag remove $tag {first} {last}",
+            )
+            for tag, indices in ranges.items():
+                if indices:
+                    self.editor.tag_add(tag, *indices)
             
             # Restore the original state if it was disabled
-            if current_state == "disabled":
+            if self._editor_disabled:
                 self.editor.config(state="disabled")
         except Exception as e:
             logger.error(f"Error in syntax highlighting: {str(e)}")
     
+    def _visible_range(self) -> tuple:
+        """
+        Get the range of whole lines currently shown in the editor.
+        
+        Returns:
+            tuple: (first, last) Tk indices from the start of the first visible
+            line to the end of the last one
+        """
+        first = self.editor.index("@0,0 linestart")
+        last = self.editor.index(f"@0,{self.editor.winfo_height()} lineend")
+        return first, last
+    
     def _load_snippets(self) -> list[str]:
         """
         Load text snippets from the snippets file in the input directory.
@@ -355,19 +515,21 @@ class MarkdownEditor:
             list[str]: List of text snippets
         """
         snippets = []
-        # Construct path to snippets file in the data/input directory
-        snippets_file = os.path.join(
-            str(get_project_root()),
-            "showup-editor-ui",
-            "data",
-            "input",
-            "snippets.txt",
-        )
+        snippets_file = _snippets_path()
         
         try:
             if os.path.exists(snippets_file):
-                with open(snippets_file, 'r', encoding='utf-8') as f:
-                    snippets = [line.strip() for line in f.readlines() if line.strip()]
+                # Reuse the parsed snippets unless the file changed since
+                mtime = os.stat(snippets_file).st_mtime_ns
+                cached = _SNIPPETS_CACHE.get(snippets_file)
+                if cached is not None and cached[0] == mtime:
+                    return list(cached[1])
+                
+                with open(snippets_file, 'r', encoding='utf-8', buffering=1 << 16) as f:
+                    content = f.read()
+                snippets = [line for line in map(str.strip, content.split("\n")) if line]
+                _SNIPPETS_CACHE[snippets_file] = (mtime, snippets)
+                snippets = list(snippets)
                 logger.info(f"Loaded {len(snippets)} snippets from {snippets_file}")
             else:
                 logger.warning(f"Snippets file not found: {snippets_file}")
@@ -388,14 +550,16 @@ class MarkdownEditor:
             self.editor.insert(current_pos, snippet)
             logger.info(f"Inserted snippet at position {current_pos}")
     
-    def _show_context_menu(self, event) -> None:
+    def _build_context_menu(self) -> None:
         """
-        Show the context menu with snippets at the cursor position.
+        Build the editor's context menu, including one entry per snippet.
         
-        Args:
-            event: The mouse event that triggered the context menu
+        The menu is kept and reused by every right-click; it is rebuilt only
+        when the snippets are reloaded.
         """
-        # Create a new context menu
+        if self._context_menu is not None:
+            self._context_menu.destroy()
+        
         context_menu = Menu(self.editor, tearoff=0)
         
         # Add default menu items
@@ -404,16 +568,6 @@ class MarkdownEditor:
         context_menu.add_command(label="Paste", command=lambda: self.editor.event_generate("<<Paste>>"))
         context_menu.add_separator()
         
-        # Add AI detection option if there's selected text
-        try:
-            selected_text = self.editor.get(tk.SEL_FIRST, tk.SEL_LAST)
-            if selected_text and self.ai_detector:
-                context_menu.add_command(label="Analyze for AI Writing", command=self._analyze_selected_text)
-                context_menu.add_separator()
-        except tk.TclError:
-            # No selection
-            pass
-        
         # Add snippets submenu if snippets exist
         if self.snippets:
             snippets_menu = Menu(context_menu, tearoff=0)
@@ -424,6 +578,32 @@ class MarkdownEditor:
                 )
             context_menu.add_cascade(label="Insert Snippet", menu=snippets_menu)
         
+        self._context_menu = context_menu
+        self._ai_menu_entry_shown = False
+    
+    def _show_context_menu(self, event) -> None:
+        """
+        Show the context menu with snippets at the cursor position.
+        
+        Args:
+            event: The mouse event that triggered the context menu
+        """
+        context_menu = self._context_menu
+        
+        # Offer AI detection, after the default items, only if there's selected text
+        try:
+            selected_text = self.editor.get(tk.SEL_FIRST, tk.SEL_LAST)
+        except tk.TclError:
+            # No selection
+            selected_text = ""
+        show_ai_entry = bool(selected_text and self.ai_detector)
+        if show_ai_entry and not self._ai_menu_entry_shown:
+            context_menu.insert_command(4, label="Analyze for AI Writing", command=self._analyze_selected_text)
+            context_menu.insert_separator(5)
+        elif self._ai_menu_entry_shown and not show_ai_entry:
+            context_menu.delete(4, 5)
+        self._ai_menu_entry_shown = show_ai_entry
+        
         # Display the context menu
         try:
             context_menu.tk_popup(event.x_root, event.y_root)
@@ -472,68 +652,64 @@ class MarkdownEditor:
             str: The formatted report text
         """
         # Start with the prefix message and opening bracket
-        report = "[Please update your content based on the following AI writing analysis: This report identifies several AI writing patterns in your text that need revision to ensure a more authentic, human-like writing style.\n"
+        parts = ["[Please update your content based on the following AI writing analysis: This report identifies several AI writing patterns in your text that need revision to ensure a more authentic, human-like writing style.\n"]
         
         # Continue with the report content
-        report += "AI WRITING PATTERN ANALYSIS REPORT\n"
-        report += "=================================\n\n"
+        parts.append("AI WRITING PATTERN ANALYSIS REPORT\n")
+        parts.append("=================================\n\n")
         
         # Add summary with AI score if available
         if detection_result["detected"]:
             ai_score = detection_result.get("ai_score", 0)
             score_assessment = "Low" if ai_score < 3 else "Medium" if ai_score < 6 else "High"
             
-            report += "RESULT: AI PATTERNS DETECTED\n"
-            report += f"Found {detection_result['count']} potential AI patterns.\n"
-            report += f"AI Score: {ai_score} - {score_assessment} likelihood of AI-generated content\n\n"
+            parts.append("RESULT: AI PATTERNS DETECTED\n")
+            parts.append(f"Found {detection_result['count']} potential AI patterns.\n")
+            parts.append(f"AI Score: {ai_score} - {score_assessment} likelihood of AI-generated content\n\n")
             
             # Add proximity cluster information if available
             if "proximity_clusters" in detection_result and detection_result["proximity_clusters"] > 0:
-                report += f"Found {detection_result['proximity_clusters']} clusters of closely positioned AI patterns\n"
-                report += "(Proximity clusters increase likelihood of AI-generated content)\n\n"
+                parts.append(f"Found {detection_result['proximity_clusters']} clusters of closely positioned AI patterns\n")
+                parts.append("(Proximity clusters increase likelihood of AI-generated content)\n\n")
                 
         else:
-            report += "RESULT: NO AI PATTERNS DETECTED\n"
-            report += "The analyzed text appears to be human-written.\n\n"
+            parts.append("RESULT: NO AI PATTERNS DETECTED\n")
+            parts.append("The analyzed text appears to be human-written.\n\n")
         
         # Add pattern summary by category
         if detection_result["detected"]:
-            report += "PATTERN SUMMARY BY CATEGORY:\n"
-            report += "----------------------------\n"
+            parts.append("PATTERN SUMMARY BY CATEGORY:\n")
+            parts.append("----------------------------\n")
             
-            categories = {}
+            # [count, total weight] per category
+            categories = defaultdict(lambda: [0, 0])
             for pattern in detection_result["patterns"]:
-                category = pattern["category"]
-                weight = pattern.get("weight", 1.0)  # Get pattern weight
-                if category not in categories:
-                    categories[category] = {"count": 0, "weight": 0}
-                categories[category]["count"] += 1
-                categories[category]["weight"] += weight
+                totals = categories[pattern["category"]]
+                totals[0] += 1
+                totals[1] += pattern.get("weight", 1.0)  # Get pattern weight
             
             # Sort categories by total weight (descending)
-            sorted_categories = sorted(categories.items(), key=lambda x: x[1]["weight"], reverse=True)
+            sorted_categories = sorted(categories.items(), key=lambda x: x[1][1], reverse=True)
             
-            for category, data in sorted_categories:
-                count = data["count"]
-                weight = data["weight"]
-                report += f"\u2022 {category}: {count} instances (weight: {weight:.1f})\n"
+            for category, (count, weight) in sorted_categories:
+                parts.append(f"\u2022 {category}: {count} instances (weight: {weight:.1f})\n")
             
-            report += "\n"
+            parts.append("\n")
             
             # Add detailed pattern matches
-            report += "DETAILED PATTERN MATCHES:\n"
-            report += "------------------------\n"
+            parts.append("DETAILED PATTERN MATCHES:\n")
+            parts.append("------------------------\n")
             
             for i, pattern in enumerate(detection_result["patterns"]):
                 weight = pattern.get("weight", 1.0)  # Get pattern weight
-                report += f"{i+1}. Category: {pattern['category']} (weight: {weight:.1f})\n"
-                report += f"   Pattern: {pattern['pattern']}\n"
-                report += f"   Match: \"{pattern['match']}\"\n\n"
+                parts.append(f"{i+1}. Category: {pattern['category']} (weight: {weight:.1f})\n")
+                parts.append(f"   Pattern: {pattern['pattern']}\n")
+                parts.append(f"   Match: \"{pattern['match']}\"\n\n")
         
         # Add alternative suggestions if available
         if detection_result.get("alternatives") and detection_result["detected"]:
-            report += "SUGGESTED ALTERNATIVES:\n"
-            report += "----------------------\n"
+            parts.append("SUGGESTED ALTERNATIVES:\n")
+            parts.append("----------------------\n")
             
             for match_text, alternatives in detection_result["alternatives"].items():
                 if isinstance(alternatives, list) and alternatives:
@@ -541,40 +717,42 @@ class MarkdownEditor:
                     alt_text = ", ".join(alternatives[:5])  # Limit to 5 alternatives
                     if len(alternatives) > 5:
                         alt_text += ", ..."
-                    report += f"\u2022 Instead of \"{match_text}\", consider: {alt_text}\n"
+                    parts.append(f"\u2022 Instead of \"{match_text}\", consider: {alt_text}\n")
                 elif isinstance(alternatives, str):
                     # For single alternative
-                    report += f"\u2022 Instead of \"{match_text}\", consider: {alternatives}\n"
+                    parts.append(f"\u2022 Instead of \"{match_text}\", consider: {alternatives}\n")
             
-            report += "\n"
+            parts.append("\n")
         
         # Add recommendations
-        report += "RECOMMENDATIONS:\n"
-        report += "----------------\n"
+        parts.append("RECOMMENDATIONS:\n")
+        parts.append("----------------\n")
         if detection_result["detected"]:
-            report += "Consider revising the following aspects to make the text more human-like:\n\n"
+            parts.append("Consider revising the following aspects to make the text more human-like:\n\n")
+            
+            present = {p["category"] for p in detection_result["patterns"]}
             
-            if any(p["category"] == "Common Phrases" for p in detection_result["patterns"]):
-                report += "\u2022 Replace common AI phrases with more natural language\n"
+            if "Common Phrases" in present:
+                parts.append("\u2022 Replace common AI phrases with more natural language\n")
             
-            if any(p["category"] == "Scenario_Prompts" for p in detection_result["patterns"]):
-                report += "\u2022 Avoid 'imagine' and 'picture this' type scenarios that are common in AI writing\n"
+            if "Scenario_Prompts" in present:
+                parts.append("\u2022 Avoid 'imagine' and 'picture this' type scenarios that are common in AI writing\n")
             
-            if any(p["category"] == "Repetitive Structures" for p in detection_result["patterns"]):
-                report += "\u2022 Vary the structure to avoid predictable patterns\n"
+            if "Repetitive Structures" in present:
+                parts.append("\u2022 Vary the structure to avoid predictable patterns\n")
             
-            if any(p["category"] == "Overused Transitions" for p in detection_result["patterns"]):
-                report += "\u2022 Use more diverse transitional phrases\n"
+            if "Overused Transitions" in present:
+                parts.append("\u2022 Use more diverse transitional phrases\n")
             
             if detection_result.get("proximity_clusters", 0) > 0:
-                report += "\u2022 Break up clusters of AI-like phrases throughout your text\n"
+                parts.append("\u2022 Break up clusters of AI-like phrases throughout your text\n")
             
-            report += "\nNote: This analysis is based on common patterns in AI-generated text "
-            report += "and may not be 100% accurate. Use your judgment when making revisions."
+            parts.append("\nNote: This analysis is based on common patterns in AI-generated text ")
+            parts.append("and may not be 100% accurate. Use your judgment when making revisions.")
         else:
-            report += "No AI patterns were detected. The text appears natural and human-like."
+            parts.append("No AI patterns were detected. The text appears natural and human-like.")
         
         # Add closing bracket
-        report += "]\n\n"
+        parts.append("]\n\n")
         
-        return report
+        return "".join(parts)
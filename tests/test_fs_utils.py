@@ -0,0 +1,103 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+fs_utils = importlib.import_module('showup_editor_ui.claude_panel.fs_utils')
+
+
+def make_tree(base):
+    (base / "lesson" / "images").mkdir(parents=True)
+    (base / "lesson" / "lesson.md").write_text("# Lesson", encoding="utf-8")
+    (base / "lesson" / "images" / "figure.png").write_bytes(b"png")
+    return base / "lesson"
+
+
+def test_deletes_nested_tree(tmp_path):
+    lesson = make_tree(tmp_path)
+    fs_utils.fast_rmtree(str(lesson))
+    assert not lesson.exists()
+
+
+def test_symlinked_directory_target_is_left_alone(tmp_path):
+    lesson = make_tree(tmp_path)
+    target = tmp_path / "shared"
+    target.mkdir()
+    (target / "keep.md").write_text("keep", encoding="utf-8")
+    try:
+        os.symlink(target, lesson / "shared", target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks are not available")
+
+    fs_utils.fast_rmtree(str(lesson))
+
+    assert not lesson.exists()
+    assert (target / "keep.md").exists()
+
+
+def test_refuses_a_symlinked_root(tmp_path):
+    target = make_tree(tmp_path)
+    link = tmp_path / "link"
+    try:
+        os.symlink(target, link, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks are not available")
+
+    with pytest.raises(OSError):
+        fs_utils.fast_rmtree(str(link))
+    assert (target / "lesson.md").exists()
+
+
+def test_junction_is_removed_without_descending(tmp_path, monkeypatch):
+    lesson = make_tree(tmp_path)
+    junction = lesson / "junction"
+    junction.mkdir()
+    (junction / "target-file.md").write_text("keep", encoding="utf-8")
+    junction_ino = os.lstat(junction).st_ino
+    outside = tmp_path / "junction-target"
+
+    # Report the junction directory as a reparse point, as Windows does
+    monkeypatch.setattr(fs_utils, "_is_reparse_point", lambda st: st.st_ino == junction_ino)
+
+    real_rmdir = os.rmdir
+    removed_links = []
+
+    def rmdir(path):
+        if os.fspath(path) == str(junction):
+            # Removing a junction drops the link; its target lives on
+            removed_links.append(path)
+            os.rename(path, outside)
+        else:
+            real_rmdir(path)
+
+    monkeypatch.setattr(fs_utils.os, "rmdir", rmdir)
+
+    fs_utils.fast_rmtree(str(lesson))
+
+    assert removed_links == [str(junction)]
+    assert not lesson.exists()
+    assert (outside / "target-file.md").exists()
+
+
+def test_permission_error_falls_back_to_shutil(tmp_path, monkeypatch):
+    lesson = make_tree(tmp_path)
+    real_unlink = os.unlink
+    refused = []
+
+    def unlink(path, *args, **kwargs):
+        if not refused:
+            refused.append(path)
+            raise PermissionError("file is in use")
+        return real_unlink(path, *args, **kwargs)
+
+    monkeypatch.setattr(fs_utils.os, "unlink", unlink)
+
+    fs_utils.fast_rmtree(str(lesson))
+
+    assert refused
+    assert not lesson.exists()
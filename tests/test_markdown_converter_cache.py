@@ -0,0 +1,93 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+converter = importlib.import_module('showup_editor_ui.claude_panel.markdown_converter_panel')
+
+LESSON = "# Lesson\n\nSome *text*.\n\n## Stop and Reflect\nWhat did you learn?\n"
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the HTML cache at a temporary directory and empty the memo."""
+    root = tmp_path / "md2html"
+    monkeypatch.setattr(converter, "_CACHE_ROOT", root)
+    monkeypatch.setattr(converter, "_CACHE_DIR", root / converter._CACHE_SALT.hex())
+    converter._cached_convert.cache_clear()
+    yield root / converter._CACHE_SALT.hex()
+    converter._cached_convert.cache_clear()
+
+
+def test_cache_entry_matches_fresh_conversion(cache_dir):
+    expected = converter.markdown_to_html(LESSON)
+    assert converter._cached_convert(LESSON) == expected
+
+    entries = os.listdir(cache_dir)
+    assert len(entries) == 1 and entries[0].endswith(".html")
+    assert (cache_dir / entries[0]).read_text(encoding="utf-8") == expected
+
+    # A later run reads the entry back from disk
+    converter._cached_convert.cache_clear()
+    assert converter._cached_convert(LESSON) == expected
+
+
+def test_entries_from_another_converter_build_are_never_served(cache_dir, monkeypatch):
+    converter._cached_convert(LESSON)
+    (old_entry,) = os.listdir(cache_dir)
+    (cache_dir / old_entry).write_text("<p>stale</p>", encoding="utf-8")
+
+    # A changed converter fingerprint keys the same content differently
+    monkeypatch.setattr(converter, "_CACHE_SALT", b"another-build")
+    converter._cached_convert.cache_clear()
+
+    assert converter._cached_convert(LESSON) == converter.markdown_to_html(LESSON)
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_failed_cache_write_leaves_no_files(cache_dir, monkeypatch):
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(converter.os, "replace", failing_replace)
+
+    assert converter._cached_convert(LESSON) == converter.markdown_to_html(LESSON)
+    assert os.listdir(cache_dir) == []
+
+
+def test_prune_removes_other_builds_and_oldest_entries(cache_dir, monkeypatch):
+    root = cache_dir.parent
+    (root / "0123456789abcdef").mkdir(parents=True)
+    (root / "0123456789abcdef" / "old.html").write_text("old", encoding="utf-8")
+    (root / "flat-layout.html").write_text("old", encoding="utf-8")
+
+    cache_dir.mkdir()
+    for age in range(5):
+        entry = cache_dir / f"{age}.html"
+        entry.write_text("x" * 1000, encoding="utf-8")
+        os.utime(entry, (age, age))
+    monkeypatch.setattr(converter, "_CACHE_MAX_BYTES", 2500)
+
+    converter._prune_html_cache()
+
+    assert os.listdir(root) == [cache_dir.name]
+    assert sorted(os.listdir(cache_dir)) == ["3.html", "4.html"]
+
+
+def test_prune_keeps_cache_under_cap(cache_dir):
+    cache_dir.mkdir(parents=True)
+    (cache_dir / "entry.html").write_text("small", encoding="utf-8")
+
+    converter._prune_html_cache()
+
+    assert os.listdir(cache_dir) == ["entry.html"]
+
+
+def test_prune_without_cache_directory_is_a_no_op(cache_dir):
+    converter._prune_html_cache()
+    assert not cache_dir.parent.exists()
@@ -0,0 +1,106 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+converter = importlib.import_module('showup_editor_ui.claude_panel.markdown_converter_panel')
+
+
+@pytest.mark.parametrize("threshold", [0, 1 << 30], ids=["mmap", "text-mode"])
+def test_read_md_normalises_newlines(tmp_path, monkeypatch, threshold):
+    monkeypatch.setattr(converter, "_MMAP_THRESHOLD", threshold)
+    path = tmp_path / "lesson.md"
+    path.write_bytes("# Café\r\nWindows line\rOld Mac line\nUnix line\n".encode("utf-8"))
+
+    assert converter._read_md(str(path)) == "# Café\nWindows line\nOld Mac line\nUnix line\n"
+
+
+def test_read_md_mmap_matches_text_mode(tmp_path, monkeypatch):
+    path = tmp_path / "lesson.md"
+    path.write_bytes(("## Heading\r\n- point   with separator\r\n" * 50).encode("utf-8"))
+
+    monkeypatch.setattr(converter, "_MMAP_THRESHOLD", 0)
+    mapped = converter._read_md(str(path))
+    monkeypatch.setattr(converter, "_MMAP_THRESHOLD", 1 << 30)
+
+    assert mapped == converter._read_md(str(path))
+
+
+def takeaways_items(markdown):
+    html = converter.pre_process_audio_instructions(markdown)
+    assert "<strong>Key Takeaways</strong>" in html
+    return html
+
+
+def test_triple_dash_key_takeaways_keeps_first_bullet():
+    html = takeaways_items(
+        "---keytakeaways---\n- First point\n- Second point\n---keytakeawaysEND---\n"
+    )
+    assert "<li>First point</li>" in html
+    assert "<li>Second point</li>" in html
+
+
+@pytest.mark.parametrize("heading", ["## Key Takeaways", "#KEY TAKEAWAYS:", "### Key  Takeaways for today"])
+def test_triple_dash_key_takeaways_drops_leading_heading(heading):
+    html = takeaways_items(
+        f"---keytakeaways---\n{heading}\n- First point\n- Second point\n---keytakeawaysEND---\n"
+    )
+    assert "<li>First point</li>" in html
+    assert "<li>Second point</li>" in html
+    assert "<h2" not in html and "<h1" not in html and html.count("<h3>") == 1
+
+
+def test_triple_dash_key_takeaways_keeps_other_headings():
+    html = takeaways_items(
+        "---keytakeaways---\n## Summary\n- First point\n---keytakeawaysEND---\n"
+    )
+    assert "Summary</h2>" in html
+    assert "<li>First point</li>" in html
+
+
+@pytest.mark.parametrize("section, expected", [
+    ("## Audio Instructions: Intro\n[Listen](https://e.test/1.mp3)",
+     ("Lesson Podcast Discussion: Intro", "https://e.test/1.mp3")),
+    ("# First title\nhttps://e.test/1.mp3\n### Second title\nPlay https://e.test/2.wav now",
+     ("Second title", "https://e.test/2.wav")),
+    ("Just a link: https://e.test/clip.ogg",
+     ("Lesson Podcast Discussion", "https://e.test/clip.ogg")),
+    ("# Title with https://e.test/heading.mp3",
+     ("Title with https://e.test/heading.mp3", "")),
+    ("No title or audio here",
+     ("Lesson Podcast Discussion", "")),
+])
+def test_parse_audio_section(section, expected):
+    assert converter._parse_audio_section(section) == expected
+
+
+@pytest.mark.parametrize("markdown", [
+    "---audioinstructions---\n## Audio Instructions: Intro\n[Listen](https://e.test/1.mp3)\n---audioinstructionsEND---\n",
+    "## Audio Instructions\n## Audio Instructions: Intro\n[Listen](https://e.test/1.mp3)\n",
+], ids=["triple-dash", "heading"])
+def test_audio_sections_render_player(markdown):
+    html = converter.markdown_to_html(markdown)
+    assert "Lesson Podcast Discussion: Intro</span>" in html
+    assert '<source src="https://e.test/1.mp3" type="audio/mpeg">' in html
+
+
+def test_audio_title_and_url_are_escaped():
+    html = converter.pre_process_audio_instructions(
+        "---audioinstructions---\n"
+        "# Audio Instructions: Week <1> & more\n"
+        "[Listen](https://e.test/a&b.mp3)\n"
+        "---audioinstructionsEND---\n"
+    )
+    assert "Lesson Podcast Discussion: Week &lt;1&gt; &amp; more</span>" in html
+    assert '<source src="https://e.test/a&amp;b.mp3" type="audio/mpeg">' in html
+    assert "<1>" not in html
+
+
+def test_heading_form_audio_title_is_escaped():
+    html = converter.create_audio_instructions_html('## Say "hi" <b>now</b>\nhttps://e.test/1.mp3')
+    assert '<span style="color:#000000;">Say "hi" &lt;b&gt;now&lt;/b&gt;</span>' in html
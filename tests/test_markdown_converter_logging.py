@@ -0,0 +1,68 @@
+import importlib
+import logging
+import os
+import sys
+import tkinter as tk
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+converter = importlib.import_module('showup_editor_ui.claude_panel.markdown_converter_panel')
+
+
+class FakeLogWidget:
+    """Stands in for the log Text widget; ``after`` fails while ``broken`` is set."""
+
+    def __init__(self):
+        self.broken = False
+        self.scheduled = []
+        self.text = ""
+
+    def after(self, delay, func):
+        if self.broken:
+            raise tk.TclError("application has been destroyed")
+        self.scheduled.append(func)
+
+    def configure(self, **kwargs):
+        pass
+
+    def insert(self, index, text):
+        self.text += text
+
+    def see(self, index):
+        pass
+
+
+def make_handler():
+    widget = FakeLogWidget()
+    handler = converter.LoggingHandler(widget)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return widget, handler
+
+
+def record(message):
+    return logging.LogRecord("test", logging.INFO, __file__, 0, message, None, None)
+
+
+def test_burst_of_records_is_flushed_once():
+    widget, handler = make_handler()
+    for message in ("one", "two", "three"):
+        handler.emit(record(message))
+
+    assert len(widget.scheduled) == 1
+    widget.scheduled.pop()()
+    assert widget.text == "one\ntwo\nthree\n"
+
+
+def test_failed_schedule_does_not_stop_later_flushes():
+    widget, handler = make_handler()
+    widget.broken = True
+    handler.emit(record("lost schedule"))
+
+    widget.broken = False
+    handler.emit(record("next"))
+
+    assert len(widget.scheduled) == 1
+    widget.scheduled.pop()()
+    assert widget.text == "lost schedule\nnext\n"
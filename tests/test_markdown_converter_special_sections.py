@@ -0,0 +1,44 @@
+import importlib
+import os
+import sys
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+converter = importlib.import_module('showup_editor_ui.claude_panel.markdown_converter_panel')
+
+KEY_THEN_STOP = (
+    "## Key Takeaways\n- First point\n- Second point\n\n"
+    "## Stop and Reflect\nWhat did you learn today?"
+)
+STOP_THEN_KEY = (
+    "## Stop and Reflect\nWhat did you learn today?\n\n"
+    "## Key Takeaways\n- First point\n- Second point\n"
+)
+
+
+def test_adjacent_sections_keep_baseline_extraction():
+    # Expected values are the output of the original per-pattern extraction
+    assert converter.extract_special_sections(KEY_THEN_STOP) == (
+        "## Key Takeaways\n- First point\n- Second point\n"
+        "<!-- SPECIAL_SECTION_STOP_REFLECT_0 -->\n",
+        [
+            ("<!-- SPECIAL_SECTION_STOP_REFLECT_0 -->", "stop_reflect", "What did you learn today?"),
+            ("<!-- SPECIAL_SECTION_KEY_TAKEAWAYS_0 -->", "key_takeaways", "- First point\n- Second point"),
+        ],
+    )
+    assert converter.extract_special_sections(STOP_THEN_KEY) == (
+        "\n<!-- SPECIAL_SECTION_STOP_REFLECT_0 -->\n Key Takeaways\n- First point\n- Second point\n",
+        [
+            ("<!-- SPECIAL_SECTION_STOP_REFLECT_0 -->", "stop_reflect", "What did you learn today?"),
+            ("<!-- SPECIAL_SECTION_KEY_TAKEAWAYS_0 -->", "key_takeaways", "- First point\n- Second point"),
+        ],
+    )
+
+
+def test_stop_and_reflect_after_key_takeaways_renders_box():
+    html = converter.markdown_to_html(KEY_THEN_STOP)
+    assert 'class="stop-reflect-container"' in html
+    assert "<p>What did you learn today?</p>" in html
+    assert "<p>Stop and Reflect" not in html
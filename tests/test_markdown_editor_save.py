@@ -0,0 +1,88 @@
+import importlib
+import os
+import sys
+import types
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+markdown_editor = importlib.import_module('showup_editor_ui.claude_panel.markdown_editor')
+
+
+class FakeWidget:
+    def __init__(self, text=""):
+        self.text = text
+
+    def config(self, **kwargs):
+        pass
+
+    def get(self, *args):
+        return self.text
+
+
+def make_editor(monkeypatch):
+    """Build a MarkdownEditor around fake widgets whose save threads run on demand."""
+    started = []
+    monkeypatch.setattr(markdown_editor, "threading", types.SimpleNamespace(
+        Thread=lambda target, args: types.SimpleNamespace(start=lambda: started.append((target, args)))
+    ))
+    monkeypatch.setattr(markdown_editor, "create_timestamped_backup", None)
+
+    editor = object.__new__(markdown_editor.MarkdownEditor)
+    editor.parent = types.SimpleNamespace(after=lambda delay, func, *args: func(*args))
+    editor.editor = FakeWidget()
+    editor.save_btn = FakeWidget()
+    editor.status_label = FakeWidget()
+    editor._saving = False
+    editor._save_pending = None
+    return editor, started
+
+
+def run_next_save(started):
+    target, args = started.pop(0)
+    target(*args)
+
+
+def test_queued_save_is_written_after_opening_another_file(monkeypatch, tmp_path):
+    first, second = tmp_path / "first.md", tmp_path / "second.md"
+    second.write_text("second file", encoding="utf-8")
+    editor, started = make_editor(monkeypatch)
+
+    editor._set_current_path(str(first))
+    editor.editor.text = "draft\n"
+    editor.save_file()
+
+    # More typing is saved while the first write is still running
+    editor.editor.text = "draft with more edits\n"
+    editor.save_file()
+    assert len(started) == 1
+
+    # Another file is opened before the first write finishes
+    editor._set_current_path(str(second))
+    editor.editor.text = "second file"
+
+    run_next_save(started)
+    assert len(started) == 1
+    run_next_save(started)
+
+    assert first.read_text(encoding="utf-8") == "draft with more edits\n"
+    assert second.read_text(encoding="utf-8") == "second file"
+    assert editor._saving is False
+    assert editor._save_pending is None
+
+
+def test_latest_queued_snapshot_wins(monkeypatch, tmp_path):
+    target = tmp_path / "lesson.md"
+    editor, started = make_editor(monkeypatch)
+
+    editor._set_current_path(str(target))
+    for text in ("one\n", "two\n", "three\n"):
+        editor.editor.text = text
+        editor.save_file()
+
+    run_next_save(started)
+    run_next_save(started)
+
+    assert not started
+    assert target.read_text(encoding="utf-8") == "three\n"